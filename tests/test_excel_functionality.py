@@ -4,12 +4,28 @@ Excelファイルの機能テスト
 
 openpyxlを使用してExcelファイルの構造と機能を検証する。
 """
+import argparse
+import copy
+import io
+import os
+import pickle
+import re
 import sys
 import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
-from typing import List, Tuple, Optional
-import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Optional
+
+# lxml があれば C 実装のパーサーを使い、なければ標準ライブラリにフォールバック
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
 
 # openpyxlをインポート
 try:
@@ -20,58 +36,211 @@ except ImportError:
     OPENPYXL_AVAILABLE = False
     print("Warning: openpyxl not installed. Some tests will be skipped.")
 
+# numba があれば WORKDAY シミュレーションのループを JIT コンパイルする
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# python-isal があれば ZIP (DEFLATE) の展開と CRC 計算を ISA-L 実装に差し替える
+try:
+    from isal import isal_zlib
+    ISAL_AVAILABLE = True
+except ImportError:
+    ISAL_AVAILABLE = False
+
+
+@contextmanager
+def _isal_inflate() -> Iterator[None]:
+    """with ブロックの間だけ zipfile の DEFLATE 展開と CRC32 を isal_zlib に差し替える
+
+    テストはアーカイブを読むだけなので、差し替えるのは展開側のみ。
+    openpyxl も zipfile 経由で読むため同じ恩恵を受ける。
+    プロセス内の他の zipfile 利用（ブックの書き出しなど）に影響しないよう、抜けるときに元へ戻す。
+    """
+    if not ISAL_AVAILABLE:
+        yield
+        return
+
+    get_decompressor = zipfile._get_decompressor
+    crc32 = zipfile.crc32
+
+    def _get_decompressor(compress_type):
+        if compress_type == zipfile.ZIP_DEFLATED:
+            return isal_zlib.decompressobj(-15)
+        return get_decompressor(compress_type)
+
+    zipfile._get_decompressor = _get_decompressor
+    zipfile.crc32 = isal_zlib.crc32
+    try:
+        yield
+    finally:
+        zipfile._get_decompressor = get_decompressor
+        zipfile.crc32 = crc32
+
+# 集計対象の関数名（数式1つにつき1回の正規表現スキャンで検出する）
+FORMULA_FUNCTIONS = frozenset((
+    'WORKDAY', 'IFS', 'SUMPRODUCT', 'COUNTIF',
+    'AVERAGEIF', 'INDIRECT', 'IFERROR', 'TODAY',
+))
+# 部分文字列として含まれていれば数える（COUNTIFS は COUNTIF と IFS の両方に該当する）。
+# 先読みで各位置から照合するため、COUNTIFS 内の IFS のような重なった一致も拾える
+_FUNC_RE = re.compile(
+    r'(?=(' + '|'.join(sorted(FORMULA_FUNCTIONS, key=len, reverse=True)) + r'))',
+    re.IGNORECASE,
+)
+
+# vbaProject.bin（OLE複合ドキュメント）の先頭シグネチャ
+OLE_SIGNATURE = b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1'
+
+# ワークシートXMLの条件付き書式ルール要素（名前空間付きタグ）
+CF_RULE_TAG = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}cfRule'
+
+# VML描画パーツの格納位置
+VML_PREFIX = 'xl/drawings/vmlDrawing'
+
+# VML描画内のフォームボタン定義の開始タグ
+VML_BUTTON_TOKEN = b'<x:ClientData ObjectType="Button"'
+
+# [Content_Types].xml の Override 要素（名前空間付きタグ）
+CT_OVERRIDE_TAG = '{http://schemas.openxmlformats.org/package/2006/content-types}Override'
+
 
 class ExcelTester:
     """Excelファイルのテストクラス"""
 
-    def __init__(self, file_path: str):
-        self.file_path = Path(file_path)
-        self.workbook = None
+    def __init__(self, file_path: Path, deep: bool = False, fail_fast: bool = False):
+        self.file_path = file_path
+        self.deep = deep  # True の場合のみ全メンバーを展開して CRC を検証する
+        self.fail_fast = fail_fast  # True の場合は最初の失敗で残りのテストを打ち切る
+        self.workbook = None  # 読み取り専用（ストリーミング）で開いたワークブック
+        self._full_workbook = None  # データバリデーション用のフルモデル（遅延ロード）
+        self._zf: Optional[zipfile.ZipFile] = None
+        self._names: frozenset = frozenset()
+        self._sheet_files: Tuple[str, ...] = ()
+        self._vml_files: Tuple[str, ...] = ()
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.passed: List[str] = []
+        # 出力はファイル単位でまとめて書き出す（並列実行時に行が混ざらないようにする）
+        self._out = io.StringIO()
+        self.output = ""
+
+    def _open_zip(self) -> zipfile.ZipFile:
+        """ZIPアーカイブを一度だけ開き、以降のテストで使い回す"""
+        if self._zf is None:
+            self._zf = zipfile.ZipFile(self.file_path, 'r')
+            # namelist() は呼ぶたびに新しいリストを返すため、一度だけ取得して使い回す
+            names = self._zf.namelist()
+            self._names = frozenset(names)
+            self._sheet_files = tuple(
+                n for n in names if n.startswith('xl/worksheets/sheet') and n.endswith('.xml')
+            )
+            self._vml_files = tuple(n for n in names if n.startswith(VML_PREFIX))
+        return self._zf
 
-    def run_all_tests(self) -> bool:
-        """全テストを実行"""
-        print(f"\n{'='*70}")
-        print(f"Excel機能テスト: {self.file_path.name}")
-        print(f"{'='*70}\n")
-
-        tests = [
-            ("ファイル存在確認", self.test_file_exists),
-            ("ZIPアーカイブ検証", self.test_zip_structure),
-            ("OpenXML構造検証", self.test_openxml_structure),
-            ("openpyxlで開く", self.test_openpyxl_load),
-            ("シート構成確認", self.test_sheet_structure),
-            ("数式存在確認", self.test_formulas_exist),
-            ("データバリデーション確認", self.test_data_validations),
-            ("条件付き書式確認", self.test_conditional_formatting),
-            ("VBAプロジェクト確認", self.test_vba_project),
-            ("VML描画確認", self.test_vml_drawings),
-        ]
+    def _load_full_workbook(self):
+        """フルモデルのワークブックを必要になった時点で一度だけ読み込む
 
+        read_only モードではデータバリデーションが読めないため、
+        それを参照するテストでのみ使用する。
+        """
+        if self._full_workbook is None:
+            # data_only=Falseで数式を保持したまま読み込む
+            self._full_workbook = openpyxl.load_workbook(
+                self.file_path,
+                data_only=False,
+                keep_vba=True  # VBAを保持
+            )
+        return self._full_workbook
+
+    def close(self) -> None:
+        """開いているZIPアーカイブ・ワークブックを閉じる"""
+        if self._zf is not None:
+            self._zf.close()
+            self._zf = None
+        if self.workbook is not None:
+            # read_only モードのワークブックはファイルハンドルを保持している
+            self.workbook.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _print(self, *args) -> None:
+        """出力をバッファに溜める"""
+        print(*args, file=self._out)
+
+    def run_all_tests(self, echo: bool = True) -> bool:
+        """全テストを実行
+
+        Args:
+            echo: True の場合、バッファした出力をまとめて標準出力に書き出す
+                  （False の場合は self.output から取得する）
+        """
+        self._print(f"\n{'='*70}")
+        self._print(f"Excel機能テスト: {self.file_path.name}")
+        self._print(f"{'='*70}\n")
+
+        try:
+            # アーカイブの読み込みはすべてテスト中に行われるため、差し替えはこの範囲に限る
+            with _isal_inflate():
+                self._run_test_stages()
+        finally:
+            self.close()
+
+        # サマリー
+        self._print(f"\n{'='*70}")
+        self._print(f"テスト結果: {len(self.passed)} passed, {len(self.errors)} failed")
+        if self.warnings:
+            self._print(f"警告: {len(self.warnings)}")
+            for w in self.warnings:
+                self._print(f"  ⚠️  {w}")
+        self._print(f"{'='*70}\n")
+
+        self.output = self._out.getvalue()
+        if echo:
+            sys.stdout.write(self.output)
+        return len(self.errors) == 0
+
+    def _run_test_stages(self) -> None:
+        """依存関係の順にテストを実行し、前提が崩れた時点で後続を打ち切る"""
+        # ファイルがなければ後続のテストはすべて失敗するため、ここで終了する
+        if not self._run_tests(self.PRECONDITION_TESTS, stop_on_failure=True):
+            return
+        if not self._run_tests(self.ARCHIVE_TESTS):
+            return
+        # openpyxl で読み込めた場合のみ、ワークブック依存のテストを実行する
+        if self.workbook is None:
+            self.warnings.append(
+                f"ワークブックが読み込まれていないため {len(self.WORKBOOK_TESTS)} 件のテストをスキップしました"
+            )
+        elif not self._run_tests(self.WORKBOOK_TESTS):
+            return
+        self._run_tests(self.PART_TESTS)
+
+    def _run_tests(self, tests, stop_on_failure: bool = False) -> bool:
+        """テスト群を順に実行する。失敗で打ち切った場合は False を返す"""
+        stop_on_failure = stop_on_failure or self.fail_fast
         for test_name, test_func in tests:
             try:
-                result = test_func()
+                result = test_func(self)
                 if result:
                     self.passed.append(test_name)
-                    print(f"  ✅ {test_name}")
+                    self._print(f"  ✅ {test_name}")
                 else:
-                    print(f"  ❌ {test_name}")
+                    self._print(f"  ❌ {test_name}")
             except Exception as e:
                 self.errors.append(f"{test_name}: {e}")
-                print(f"  ❌ {test_name}: {e}")
-
-        # サマリー
-        print(f"\n{'='*70}")
-        print(f"テスト結果: {len(self.passed)} passed, {len(self.errors)} failed")
-        if self.warnings:
-            print(f"警告: {len(self.warnings)}")
-            for w in self.warnings:
-                print(f"  ⚠️  {w}")
-        print(f"{'='*70}\n")
-
-        return len(self.errors) == 0
+                self._print(f"  ❌ {test_name}: {e}")
+                result = False
+            if not result and stop_on_failure:
+                return False
+        return True
 
     def test_file_exists(self) -> bool:
         """ファイルが存在するか確認"""
@@ -83,24 +252,37 @@ class ExcelTester:
     def test_zip_structure(self) -> bool:
         """ZIPアーカイブとして正しいか確認"""
         try:
-            with zipfile.ZipFile(self.file_path, 'r') as zf:
-                # 破損チェック
+            zf = self._open_zip()
+            # 破損チェック
+            if self.deep:
+                # 全メンバーを展開して CRC を照合する（大きなファイルでは高コスト）
                 bad_file = zf.testzip()
                 if bad_file:
                     self.errors.append(f"ZIPファイルが破損: {bad_file}")
                     return False
-
-                # 必須ファイルの確認
-                required = [
-                    '[Content_Types].xml',
-                    '_rels/.rels',
-                    'xl/workbook.xml',
-                    'xl/styles.xml',
-                ]
-                for req in required:
-                    if req not in zf.namelist():
-                        self.errors.append(f"必須ファイルがありません: {req}")
+            else:
+                # セントラルディレクトリは ZipFile を開いた時点で解析済み。
+                # 各メンバーを開いてローカルヘッダー（シグネチャ・ファイル名）との整合性のみ確認する
+                # （データは展開しないため、メンバー内容の破損は --deep でしか検出できない）
+                for info in zf.infolist():
+                    try:
+                        with zf.open(info):
+                            pass
+                    except zipfile.BadZipFile as e:
+                        self.errors.append(f"ZIPローカルヘッダーが不整合: {info.filename}: {e}")
                         return False
+
+            # 必須ファイルの確認
+            required = [
+                '[Content_Types].xml',
+                '_rels/.rels',
+                'xl/workbook.xml',
+                'xl/styles.xml',
+            ]
+            for req in required:
+                if req not in self._names:
+                    self.errors.append(f"必須ファイルがありません: {req}")
+                    return False
             return True
         except zipfile.BadZipFile as e:
             self.errors.append(f"無効なZIPファイル: {e}")
@@ -109,31 +291,30 @@ class ExcelTester:
     def test_openxml_structure(self) -> bool:
         """OpenXML構造が正しいか確認"""
         try:
-            with zipfile.ZipFile(self.file_path, 'r') as zf:
-                # Content_Typesを解析
-                content_types = zf.read('[Content_Types].xml')
-                root = ET.fromstring(content_types)
-
-                # ワークシートのコンテンツタイプを確認
-                ns = {'ct': 'http://schemas.openxmlformats.org/package/2006/content-types'}
-                overrides = root.findall('.//ct:Override', ns)
-
-                has_workbook = False
-                has_worksheet = False
-                for override in overrides:
-                    part_name = override.get('PartName', '')
-                    content_type = override.get('ContentType', '')
-                    if 'workbook' in part_name.lower():
+            zf = self._open_zip()
+            # Content_Typesをストリーミングで解析し、ワークシートのコンテンツタイプを確認
+            has_workbook = False
+            has_worksheet = False
+            with zf.open('[Content_Types].xml') as f:
+                for _, elem in ET.iterparse(f, events=('start',)):
+                    if elem.tag != CT_OVERRIDE_TAG:
+                        continue
+                    part_name = elem.get('PartName', '').lower()
+                    if 'workbook' in part_name:
                         has_workbook = True
-                    if 'worksheet' in part_name.lower():
+                    if 'worksheet' in part_name:
                         has_worksheet = True
-
-                if not has_workbook:
-                    self.errors.append("workbook.xmlのコンテンツタイプがありません")
-                    return False
-                if not has_worksheet:
-                    self.errors.append("worksheetのコンテンツタイプがありません")
-                    return False
+                    elem.clear()
+                    # 両方見つかった時点で残りは読まない
+                    if has_workbook and has_worksheet:
+                        break
+
+            if not has_workbook:
+                self.errors.append("workbook.xmlのコンテンツタイプがありません")
+                return False
+            if not has_worksheet:
+                self.errors.append("worksheetのコンテンツタイプがありません")
+                return False
 
             return True
         except ET.ParseError as e:
@@ -147,11 +328,12 @@ class ExcelTester:
             return True  # スキップ
 
         try:
-            # data_only=Falseで数式を保持したまま読み込む
+            # セル値の走査だけなら read_only で十分（Cell オブジェクトのグラフを構築しない）
             self.workbook = openpyxl.load_workbook(
                 self.file_path,
+                read_only=True,
                 data_only=False,
-                keep_vba=True  # VBAを保持
+                keep_links=False
             )
             return True
         except Exception as e:
@@ -160,10 +342,6 @@ class ExcelTester:
 
     def test_sheet_structure(self) -> bool:
         """シート構成を確認"""
-        if not self.workbook:
-            self.warnings.append("ワークブックが読み込まれていません")
-            return True
-
         expected_sheets = ['Config', 'Template', 'PRJ_001', 'PRJ_002',
                           'Case_Master', 'Measure_Master', 'Kanban_View']
 
@@ -174,88 +352,88 @@ class ExcelTester:
             self.errors.append(f"シートがありません: {missing}")
             return False
 
-        print(f"      シート数: {len(actual_sheets)}")
+        self._print(f"      シート数: {len(actual_sheets)}")
         return True
 
     def test_formulas_exist(self) -> bool:
         """数式が存在するか確認"""
-        if not self.workbook:
-            self.warnings.append("ワークブックが読み込まれていません")
-            return True
-
         formula_count = 0
         formula_types = set()
 
         for sheet_name in self.workbook.sheetnames:
             sheet = self.workbook[sheet_name]
-            for row in sheet.iter_rows():
-                for cell in row:
-                    if cell.value and isinstance(cell.value, str):
-                        if cell.value.startswith('='):
-                            formula_count += 1
-                            # 数式の種類を特定
-                            for func in ['WORKDAY', 'IFS', 'SUMPRODUCT', 'COUNTIF',
-                                        'AVERAGEIF', 'INDIRECT', 'IFERROR', 'TODAY']:
-                                if func in cell.value.upper():
-                                    formula_types.add(func)
+            # 宣言上の寸法（<dimension>）が実データより広いと、read_only でも各行が
+            # 最大列まで None で埋められる。寸法を外して実在するセルだけを走査する
+            sheet.reset_dimensions()
+            for row in sheet.iter_rows(values_only=True):
+                if not row:
+                    continue  # 欠落している空行
+                for value in row:
+                    if isinstance(value, str) and value.startswith('='):
+                        formula_count += 1
+                        # 数式の種類を特定
+                        # Excel は関数名を大文字で保存するため、通常は upper() を呼ばずに済む
+                        for func in _FUNC_RE.findall(value):
+                            formula_types.add(func if func in FORMULA_FUNCTIONS else func.upper())
 
         if formula_count == 0:
             self.errors.append("数式が見つかりません")
             return False
 
-        print(f"      数式数: {formula_count}")
-        print(f"      使用関数: {', '.join(sorted(formula_types))}")
+        self._print(f"      数式数: {formula_count}")
+        self._print(f"      使用関数: {', '.join(sorted(formula_types))}")
         return True
 
     def test_data_validations(self) -> bool:
         """データバリデーションを確認"""
-        if not self.workbook:
-            self.warnings.append("ワークブックが読み込まれていません")
-            return True
-
+        workbook = self._load_full_workbook()
         validation_count = 0
-        for sheet_name in self.workbook.sheetnames:
-            sheet = self.workbook[sheet_name]
+        for sheet_name in workbook.sheetnames:
+            sheet = workbook[sheet_name]
             if hasattr(sheet, 'data_validations') and sheet.data_validations:
                 validation_count += len(sheet.data_validations.dataValidation)
 
-        print(f"      バリデーション数: {validation_count}")
+        self._print(f"      バリデーション数: {validation_count}")
         return validation_count > 0
 
     def test_conditional_formatting(self) -> bool:
-        """条件付き書式を確認"""
-        if not self.workbook:
-            self.warnings.append("ワークブックが読み込まれていません")
-            return True
+        """条件付き書式を確認
 
+        openpyxl でルールオブジェクトを構築せず、シートXMLをストリーミングで
+        走査して cfRule 要素を数える。
+        """
+        zf = self._open_zip()
         cf_count = 0
-        for sheet_name in self.workbook.sheetnames:
-            sheet = self.workbook[sheet_name]
-            if hasattr(sheet, 'conditional_formatting'):
-                cf_count += len(sheet.conditional_formatting._cf_rules)
-
-        print(f"      条件付き書式数: {cf_count}")
+        for name in self._sheet_files:
+            with zf.open(name) as f:
+                for _, elem in ET.iterparse(f, events=('end',)):
+                    if elem.tag == CF_RULE_TAG:
+                        cf_count += 1
+                    elem.clear()  # 走査済み要素を解放してメモリを一定に保つ
+
+        self._print(f"      条件付き書式ルール数: {cf_count}")
         return cf_count > 0
 
     def test_vba_project(self) -> bool:
         """VBAプロジェクトを確認"""
         try:
-            with zipfile.ZipFile(self.file_path, 'r') as zf:
-                if 'xl/vbaProject.bin' in zf.namelist():
-                    vba_size = zf.getinfo('xl/vbaProject.bin').file_size
-                    print(f"      vbaProject.bin: {vba_size} bytes")
-
-                    # OLEシグネチャを確認
-                    vba_data = zf.read('xl/vbaProject.bin')
-                    if vba_data[:8] == b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1':
-                        print(f"      OLE形式: 有効")
-                        return True
-                    else:
-                        self.warnings.append("vbaProject.binがOLE形式ではありません")
-                        return True
+            zf = self._open_zip()
+            if 'xl/vbaProject.bin' in self._names:
+                vba_size = zf.getinfo('xl/vbaProject.bin').file_size
+                self._print(f"      vbaProject.bin: {vba_size} bytes")
+
+                # OLEシグネチャを確認（先頭8バイトだけを展開して読む）
+                with zf.open('xl/vbaProject.bin') as f:
+                    header = f.read(8)
+                if header == OLE_SIGNATURE:
+                    self._print(f"      OLE形式: 有効")
+                    return True
                 else:
-                    self.warnings.append("vbaProject.binがありません（VBAなしファイル）")
+                    self.warnings.append("vbaProject.binがOLE形式ではありません")
                     return True
+            else:
+                self.warnings.append("vbaProject.binがありません（VBAなしファイル）")
+                return True
         except Exception as e:
             self.errors.append(f"VBAプロジェクト確認エラー: {e}")
             return False
@@ -263,25 +441,83 @@ class ExcelTester:
     def test_vml_drawings(self) -> bool:
         """VML描画（ボタン等）を確認"""
         try:
-            with zipfile.ZipFile(self.file_path, 'r') as zf:
-                vml_files = [f for f in zf.namelist() if 'vmlDrawing' in f]
-                if vml_files:
-                    print(f"      VMLファイル: {len(vml_files)}")
-
-                    # ボタンの確認
-                    for vml_file in vml_files:
-                        vml_content = zf.read(vml_file).decode('utf-8')
-                        button_count = vml_content.count('<x:ClientData ObjectType="Button"')
-                        if button_count > 0:
-                            print(f"        {Path(vml_file).name}: ボタン{button_count}個")
-                    return True
-                else:
-                    self.warnings.append("VML描画がありません（ボタンなしファイル）")
-                    return True
+            zf = self._open_zip()
+            vml_files = self._vml_files
+            if vml_files:
+                self._print(f"      VMLファイル: {len(vml_files)}")
+
+                # ボタンの確認
+                for vml_file in vml_files:
+                    # 検索トークンは ASCII のみなので、デコードせずバイト列のまま数える
+                    button_count = zf.read(vml_file).count(VML_BUTTON_TOKEN)
+                    if button_count > 0:
+                        self._print(f"        {vml_file.rsplit('/', 1)[-1]}: ボタン{button_count}個")
+                return True
+            else:
+                self.warnings.append("VML描画がありません（ボタンなしファイル）")
+                return True
         except Exception as e:
             self.errors.append(f"VML確認エラー: {e}")
             return False
 
+    # テスト一覧（クラス定義時に一度だけ構築し、run_all_tests で使い回す）
+    # 前提条件: 失敗したら以降のテストは実行しない
+    PRECONDITION_TESTS: Tuple[Tuple[str, Callable[['ExcelTester'], bool]], ...] = (
+        ("ファイル存在確認", test_file_exists),
+    )
+    ARCHIVE_TESTS: Tuple[Tuple[str, Callable[['ExcelTester'], bool]], ...] = (
+        ("ZIPアーカイブ検証", test_zip_structure),
+        ("OpenXML構造検証", test_openxml_structure),
+        ("openpyxlで開く", test_openpyxl_load),
+    )
+    # openpyxl で読み込んだワークブックが必要なテスト
+    WORKBOOK_TESTS: Tuple[Tuple[str, Callable[['ExcelTester'], bool]], ...] = (
+        ("シート構成確認", test_sheet_structure),
+        ("数式存在確認", test_formulas_exist),
+        ("データバリデーション確認", test_data_validations),
+    )
+    # ZIP 内のパーツを直接読むテスト
+    PART_TESTS: Tuple[Tuple[str, Callable[['ExcelTester'], bool]], ...] = (
+        ("条件付き書式確認", test_conditional_formatting),
+        ("VBAプロジェクト確認", test_vba_project),
+        ("VML描画確認", test_vml_drawings),
+    )
+
+
+def _workday_ordinal(start_ord: int, days: int, holidays) -> int:
+    """WORKDAY の本体（日付は序数、祝日は昇順ソート済みの序数列）
+
+    numba で JIT コンパイルできるよう、整数演算と添字アクセスだけで記述する。
+    """
+    current = start_ord
+    remaining = days
+    direction = 1 if days >= 0 else -1
+    n = len(holidays)
+
+    while remaining != 0:
+        current += direction
+        # date.fromordinal(1) は月曜日なので (序数 - 1) % 7 が weekday() と一致する
+        if (current - 1) % 7 >= 5:
+            continue
+        # 祝日判定（二分探索）
+        lo = 0
+        hi = n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if holidays[mid] < current:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < n and holidays[lo] == current:
+            continue
+        remaining -= direction
+
+    return current
+
+
+if NUMBA_AVAILABLE:
+    _workday_ordinal = njit(cache=True)(_workday_ordinal)
+
 
 def test_formula_calculation():
     """数式計算のテスト（シミュレーション）"""
@@ -290,22 +526,14 @@ def test_formula_calculation():
     print("="*70 + "\n")
 
     # WORKDAYのテスト
-    from datetime import date, timedelta
+    from datetime import date
 
     def workday(start_date: date, days: int, holidays: List[date] = None) -> date:
         """WORKDAYのシミュレーション"""
-        if holidays is None:
-            holidays = []
-        current = start_date
-        remaining = days
-        direction = 1 if days >= 0 else -1
-
-        while remaining != 0:
-            current += timedelta(days=direction)
-            if current.weekday() < 5 and current not in holidays:  # 平日かつ祝日でない
-                remaining -= direction
-
-        return current
+        holiday_ords = sorted(h.toordinal() for h in holidays or ())
+        if NUMBA_AVAILABLE:
+            holiday_ords = np.array(holiday_ords, dtype=np.int64)
+        return date.fromordinal(_workday_ordinal(start_date.toordinal(), days, holiday_ords))
 
     # テストケース
     start = date(2025, 12, 15)
@@ -343,27 +571,93 @@ def test_formula_calculation():
     print("\n  ✅ 数式計算シミュレーション完了")
 
 
+def test_sample_task_pickle_and_copy():
+    """SampleTask（frozen + slots）がプロセスプールへの受け渡しやコピーで壊れないこと"""
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+    from build_workbook import SAMPLE_TASKS
+
+    task = SAMPLE_TASKS[0]
+    for clone in (pickle.loads(pickle.dumps(task)), copy.copy(task), copy.deepcopy(task)):
+        assert clone == task
+        assert clone.status == task.status
+
+
+def test_parallel_build_zip_integrity():
+    """--workers 2 で圧縮済みパートを直接書き込んだブックが ZIP として壊れていないこと"""
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+    from build_workbook import build_workbook
+
+    with tempfile.TemporaryDirectory() as tmp:
+        xlsx_path = Path(tmp) / "parallel.xlsx"
+        build_workbook(3, True, False, xlsx_path, workers=2)
+        with zipfile.ZipFile(xlsx_path) as zf:
+            # 全メンバーを展開し、セントラルディレクトリの CRC・サイズと照合する
+            assert zf.testzip() is None
+            assert len(zf.namelist()) == len(set(zf.namelist()))
+
+
+def run_file_tests(file_path: Path, deep: bool = False, fail_fast: bool = False) -> Dict[str, Any]:
+    """1ファイル分のテストを実行し、プロセス間で受け渡せる結果を返す"""
+    tester = ExcelTester(file_path, deep=deep, fail_fast=fail_fast)
+    success = tester.run_all_tests(echo=False)
+    return {
+        'file': str(file_path),
+        'success': success,
+        'output': tester.output,
+        'passed': tester.passed,
+        'errors': tester.errors,
+        'warnings': tester.warnings,
+    }
+
+
 def main():
     """メイン関数"""
-    if len(sys.argv) < 2:
-        # デフォルトのテストファイル
-        test_files = [
-            "output/ModernExcelPMS.xlsx",
-            "output/ModernExcelPMS_regen.xlsm",
-        ]
-    else:
-        test_files = sys.argv[1:]
-
-    all_passed = True
+    parser = argparse.ArgumentParser(description="Excelファイルの機能テスト")
+    parser.add_argument("files", nargs="*", help="テスト対象の .xlsx / .xlsm ファイル")
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="全メンバーを展開して CRC を検証する（zipfile.testzip、低速）",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="ファイルごとに最初の失敗で残りのテストを打ち切る",
+    )
+    args = parser.parse_args()
+
+    # デフォルトのテストファイル
+    test_files = args.files or [
+        "output/ModernExcelPMS.xlsx",
+        "output/ModernExcelPMS_regen.xlsm",
+    ]
 
-    for file_path in test_files:
-        if Path(file_path).exists():
-            tester = ExcelTester(file_path)
-            if not tester.run_all_tests():
-                all_passed = False
+    # Path は一度だけ構築し、存在確認（stat）も1ファイル1回にする
+    existing_files: List[Path] = []
+    for file_path in map(Path, test_files):
+        if file_path.exists():
+            existing_files.append(file_path)
         else:
             print(f"⚠️  ファイルが見つかりません: {file_path}")
 
+    if len(existing_files) > 1:
+        # ファイルごとのテストは互いに独立しているため、プロセスプールで並列実行する
+        # （openpyxl / XML パースは GIL を握るのでスレッドではなくプロセスを使う）
+        max_workers = min(len(existing_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                run_file_tests, existing_files, repeat(args.deep), repeat(args.fail_fast)
+            ))
+    else:
+        results = [
+            run_file_tests(file_path, deep=args.deep, fail_fast=args.fail_fast)
+            for file_path in existing_files
+        ]
+
+    for result in results:
+        sys.stdout.write(result['output'])
+    all_passed = all(result['success'] for result in results)
+
     # 数式計算シミュレーション
     test_formula_calculation()
 
@@ -4,15 +4,32 @@ Excel WBS ファイルの仕様検証テストスクリプト
 
 README.mdの仕様に基づいてxlsxファイルを検証する。
 """
+import io
 import os
+import posixpath
 import sys
-import zipfile
 import tempfile
-import xml.etree.ElementTree as ET
-from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional, Any, NamedTuple
+from collections import Counter
 from dataclasses import dataclass
-import re
+from pathlib import Path
+
+# lxml があれば C 実装のパーサー / XPath を使い、なければ標準ライブラリにフォールバック
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
+# numpy があれば日付値の分類を配列演算でまとめて行う
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 # OpenXML名前空間
 NS = {
@@ -22,6 +39,73 @@ NS = {
     'ct': 'http://schemas.openxmlformats.org/package/2006/content-types',
 }
 
+# セル走査ループ用の Clark 表記タグ（ElementPath の接頭辞解決を省く）
+MAIN = '{%s}' % NS['main']
+TAG_ROW = MAIN + 'row'
+TAG_C = MAIN + 'c'
+TAG_F = MAIN + 'f'
+TAG_V = MAIN + 'v'
+TAG_T = MAIN + 't'
+TAG_IS = MAIN + 'is'
+TAG_R = MAIN + 'r'
+TAG_SI = MAIN + 'si'
+
+# 共有文字列テーブルのパス（--shared-strings で生成したブックに含まれる）
+SHARED_STRINGS_PATH = 'xl/sharedStrings.xml'
+
+# 検証で使う検索パス（Clark 表記で事前に組み立て、呼び出しごとの接頭辞解決を省く）
+TAG_SHEET = MAIN + 'sheet'
+TAG_SHEETS = MAIN + 'sheets'
+XP_RELATIONSHIP = '{%s}Relationship' % NS['rel']
+XP_FONT = './/' + MAIN + 'font'
+XP_FONT_NAME = MAIN + 'name'
+XP_FILL = './/' + MAIN + 'fill'
+XP_FG_COLOR = './/' + MAIN + 'fgColor'
+XP_CELLXFS = './/' + MAIN + 'cellXfs'
+XP_DXFS = './/' + MAIN + 'dxfs'
+XP_COLS = './/' + MAIN + 'cols'
+XP_COL = MAIN + 'col'
+XP_PANE = './/' + MAIN + 'pane'
+XP_CF = './/' + MAIN + 'conditionalFormatting'
+XP_CF_RULE = MAIN + 'cfRule'
+XP_SHEET_PROTECTION = './/' + MAIN + 'sheetProtection'
+XP_DATA_VALIDATIONS = './/' + MAIN + 'dataValidations'
+XP_SHEET_DATA = './/' + MAIN + 'sheetData'
+
+
+def find_inline_text(cell) -> Optional[Any]:
+    """セル内のインライン文字列要素を返す
+
+    <t> は c/is/t（リッチテキストは c/is/r/t）の固定位置にあるため、
+    子孫軸の検索を使わず直接たどる。
+    """
+    is_elem = cell.find(TAG_IS)
+    if is_elem is None:
+        return None
+    t = is_elem.find(TAG_T)
+    if t is None:
+        run = is_elem.find(TAG_R)
+        if run is not None:
+            t = run.find(TAG_T)
+    return t
+
+
+def find_cell_text(cell, shared_strings: List[str]) -> Optional[str]:
+    """セルの文字列を返す（インライン文字列と共有文字列参照 t="s" の両方に対応）"""
+    if cell.get('t') == 's':
+        v = cell.find(TAG_V)
+        return _shared_string(shared_strings, v.text if v is not None else None)
+    t = find_inline_text(cell)
+    return t.text if t is not None else None
+
+
+def _shared_string(shared_strings: List[str], index: Optional[str]) -> Optional[str]:
+    """共有文字列テーブルのインデックスを文字列に解決する（範囲外・不正な値は None）"""
+    try:
+        return shared_strings[int(index)]
+    except (TypeError, ValueError, IndexError):
+        return None
+
 
 @dataclass
 class ValidationResult:
@@ -50,50 +134,365 @@ class TestReport:
         return sum(1 for r in self.results if not r.passed)
 
 
+class CellRecord(NamedTuple):
+    """scan_sheet が返すセル1件分の情報"""
+    row: int
+    ref: str
+    style: str
+    formula: Optional[str]
+    value: Optional[str]
+    inline_text: Optional[str]
+
+
+def _cell_record(cell, row_num: int, shared_strings: List[str]) -> CellRecord:
+    """<c> 要素から CellRecord を作る
+
+    共有文字列参照（t="s"）のセルは <v> のインデックスを解決し、
+    インライン文字列と同じく inline_text に入れる（value は None）。
+    """
+    # セルごとに呼ばれるため、メソッドはローカル名に束縛して属性参照を減らす
+    find = cell.find
+    get = cell.get
+    f = find(TAG_F)
+    v = find(TAG_V)
+    if get('t') == 's':
+        value = None
+        text = _shared_string(shared_strings, v.text if v is not None else None)
+    else:
+        value = (v.text or '') if v is not None else None
+        t = find_inline_text(cell)
+        text = t.text if t is not None else None
+    return CellRecord(
+        row_num,
+        get('r', ''),
+        get('s', '0'),
+        f.text if f is not None else None,
+        value,
+        text,
+    )
+
+
+if LXML_AVAILABLE:
+    def _scan_cells(fp, shared_strings: List[str]) -> List[CellRecord]:
+        """シート XML のセルを走査する（lxml 版）
+
+        タグの絞り込みを lxml の C 実装側で行い、Python に戻るのは row / c の
+        イベントだけにする。処理済みの行は前の兄弟ごと削除してメモリを抑える。
+        """
+        records = []
+        append = records.append
+        make_record = _cell_record
+        tag_row, tag_c = TAG_ROW, TAG_C
+        row_num = 0
+        for event, elem in ET.iterparse(fp, events=('start', 'end'), tag=(tag_row, tag_c)):
+            if event == 'start':
+                if elem.tag == tag_row:
+                    row_num = int(elem.get('r', '0'))
+                continue
+            if elem.tag == tag_c:
+                append(make_record(elem, row_num, shared_strings))
+            else:
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        return records
+else:
+    def _scan_cells(fp, shared_strings: List[str]) -> List[CellRecord]:
+        """シート XML のセルを走査する（標準ライブラリ版）"""
+        records = []
+        append = records.append
+        make_record = _cell_record
+        tag_row, tag_c = TAG_ROW, TAG_C
+        row_num = 0
+        for event, elem in ET.iterparse(fp, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == tag_row:
+                    row_num = int(elem.get('r', '0'))
+                continue
+            if tag == tag_c:
+                append(make_record(elem, row_num, shared_strings))
+                elem.clear()
+            elif tag == tag_row:
+                # 処理済みの行を解放してメモリを抑える
+                elem.clear()
+        return records
+
+
+@dataclass
+class SheetFacts:
+    """1シート分のセル走査結果（各検証関数で共有する）"""
+    formulas: List[Tuple[str, str]]
+    style_usage: Counter
+    row4_texts: List[Optional[str]]
+    row4_styles: set
+    input_styles: set
+    numeric_date_count: int
+    string_dates: List[Tuple[str, str, Any]]
+
+
+# Excel日付範囲（シリアル値）
+DATE_SERIAL_MIN = 40000
+DATE_SERIAL_MAX = 50000
+
+if NUMPY_AVAILABLE:
+    def _classify_date_values(date_values: List[Tuple[str, str]]) -> Tuple[int, List[Tuple[str, str, Any]]]:
+        """D列の <v> 値を分類し、(日付シリアル値の件数, 数値でない値の一覧) を返す（numpy 版）
+
+        文字列→float 変換と範囲判定を配列演算で一括して行う。
+        数値に変換できない値が含まれる場合だけ標準ライブラリ版で1件ずつ判定する。
+        """
+        if not date_values:
+            return 0, []
+        try:
+            vals = np.array([raw for _, raw in date_values], dtype=np.float64)
+        except ValueError:
+            return _classify_date_values_py(date_values)
+        return int(((vals > DATE_SERIAL_MIN) & (vals < DATE_SERIAL_MAX)).sum()), []
+else:
+    def _classify_date_values(date_values: List[Tuple[str, str]]) -> Tuple[int, List[Tuple[str, str, Any]]]:
+        """D列の <v> 値を分類し、(日付シリアル値の件数, 数値でない値の一覧) を返す"""
+        return _classify_date_values_py(date_values)
+
+
+def _classify_date_values_py(date_values: List[Tuple[str, str]]) -> Tuple[int, List[Tuple[str, str, Any]]]:
+    """_classify_date_values の標準ライブラリ版（1件ずつ float 変換する）"""
+    numeric_count = 0
+    text_dates = []
+    for ref, raw in date_values:
+        try:
+            val = float(raw)
+        except ValueError:
+            text_dates.append((ref, 'text', raw))
+            continue
+        if DATE_SERIAL_MIN < val < DATE_SERIAL_MAX:
+            numeric_count += 1
+    return numeric_count, text_dates
+
+
+def _collect_sheet_facts(cells: List[CellRecord]) -> SheetFacts:
+    """セル情報を1回だけ走査し、数式・スタイル・日付の各検証に必要な値をまとめる"""
+    # スタイル使用数の集計は Counter に任せる（C 実装で1パス）
+    facts = SheetFacts([], Counter(cell.style for cell in cells), [], set(), set(), 0, [])
+    date_values = []
+
+    # ループ内の属性参照を避けるため、追加先のメソッドをローカル名に束縛する
+    add_formula = facts.formulas.append
+    add_row4_text = facts.row4_texts.append
+    add_row4_style = facts.row4_styles.add
+    add_input_style = facts.input_styles.add
+    add_date_value = date_values.append
+    add_inline_date = facts.string_dates.append
+
+    # NamedTuple のプロパティ参照ではなくタプル展開で各値を取り出す
+    for row, ref, style, formula, value, inline_text in cells:
+        if formula:
+            add_formula((ref, formula))
+
+        if row == 4:
+            add_row4_text(inline_text)
+            add_row4_style(style)
+        elif row >= 5:
+            add_input_style(style)
+
+            # D列（開始日）の値を収集（<v> の分類はループ後にまとめて行う）
+            if not ref.startswith('D'):
+                continue
+            if value is not None:
+                add_date_value((ref, value))
+            elif inline_text:
+                # 空のinline_stringは無視（スタイルのみのセル）
+                add_inline_date((ref, 'inline_string', inline_text))
+
+    facts.numeric_date_count, text_dates = _classify_date_values(date_values)
+    facts.string_dates[:0] = text_dates
+    return facts
+
+
+# 検証で読むシート（シート名判明後に先読みする）
+PREFETCH_SHEETS = ('Config', 'Template', 'PRJ_001')
+
+
 class XlsxValidator:
     """Excelファイルの検証クラス"""
 
     def __init__(self, xlsx_path: str):
         self.xlsx_path = xlsx_path
-        self.temp_dir = None
-        self.extracted_path = None
+        self.zf: Optional[zipfile.ZipFile] = None
+        self.names: set = set()
+        self._xml_cache: Dict[str, Optional[ET.Element]] = {}
+        self._sheet_names: Optional[List[str]] = None
+        self._sheet_paths: Dict[str, str] = {}
+        self._cell_cache: Dict[str, Optional[List[CellRecord]]] = {}
+        self._facts_cache: Dict[str, Optional[SheetFacts]] = {}
+        self._shared_strings: Optional[List[str]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch: Dict[str, Future] = {}
 
     def __enter__(self):
-        self.temp_dir = tempfile.mkdtemp(prefix='xlsx_validate_')
-        with zipfile.ZipFile(self.xlsx_path, 'r') as zf:
-            zf.extractall(self.temp_dir)
-        self.extracted_path = Path(self.temp_dir)
+        # 一時ディレクトリへ展開せず、ZIP を開いたまま必要なメンバーだけを読む
+        self.zf = zipfile.ZipFile(self.xlsx_path, 'r')
+        self.names = set(self.zf.namelist())
+        # 展開（zlib は GIL を解放する）をバックグラウンドで進め、パースと重ねる
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self.prefetch(['xl/workbook.xml', 'xl/_rels/workbook.xml.rels', 'xl/styles.xml', SHARED_STRINGS_PATH])
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        import shutil
-        if self.temp_dir:
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._prefetch.clear()
+        if self.zf:
+            self.zf.close()
+
+    def prefetch(self, relative_paths: List[str]):
+        """ZIP メンバーの展開をワーカースレッドで先行開始する"""
+        if self._executor is None:
+            return
+        for relative_path in relative_paths:
+            if relative_path in self.names and relative_path not in self._prefetch:
+                self._prefetch[relative_path] = self._executor.submit(self.zf.read, relative_path)
+
+    def _open_member(self, relative_path: str):
+        """ZIP メンバーを開く（先読み済みならその内容を使う）"""
+        future = self._prefetch.get(relative_path)
+        if future is not None:
+            return io.BytesIO(future.result())
+        return self.zf.open(relative_path)
 
     def read_xml(self, relative_path: str) -> Optional[ET.Element]:
-        """XMLファイルを読み込む"""
-        full_path = self.extracted_path / relative_path
-        if not full_path.exists():
+        """XMLファイルを読み込む（パースしたルートはパスごとにキャッシュする）"""
+        if relative_path not in self._xml_cache:
+            self._xml_cache[relative_path] = self._parse_xml(relative_path)
+        return self._xml_cache[relative_path]
+
+    def _parse_xml(self, relative_path: str) -> Optional[ET.Element]:
+        """ZIP 内の XML をパースする"""
+        if relative_path not in self.names:
             return None
         try:
-            tree = ET.parse(full_path)
-            return tree.getroot()
+            with self._open_member(relative_path) as fp:
+                return ET.parse(fp).getroot()
         except ET.ParseError as e:
             print(f"XML Parse Error in {relative_path}: {e}")
             return None
 
     def get_sheet_names(self) -> List[str]:
         """シート名一覧を取得"""
-        workbook = self.read_xml('xl/workbook.xml')
-        if workbook is None:
+        if self._sheet_names is not None:
+            return self._sheet_names
+
+        sheets = self._read_workbook_sheets()
+        if sheets is None:
             return []
 
-        sheets = workbook.findall('.//main:sheet', NS)
-        return [s.get('name', '') for s in sheets]
+        # r:id → ZIP 内パス（ワークシートのファイル番号はシート順とは限らないため rels で解決する）
+        targets = {}
+        rels = self.read_xml('xl/_rels/workbook.xml.rels')
+        if rels is not None:
+            for rel in rels.iterfind(XP_RELATIONSHIP):
+                target = rel.get('Target', '')
+                if target.startswith('/'):
+                    targets[rel.get('Id')] = target[1:]
+                else:
+                    targets[rel.get('Id')] = posixpath.normpath(posixpath.join('xl', target))
+
+        self._sheet_names = []
+        for i, (name, rid) in enumerate(sheets):
+            self._sheet_names.append(name)
+            self._sheet_paths[name] = targets.get(rid, f'xl/worksheets/sheet{i + 1}.xml')
+
+        self.prefetch([self._sheet_paths[name] for name in PREFETCH_SHEETS if name in self._sheet_paths])
+        return self._sheet_names
+
+    def _read_workbook_sheets(self) -> Optional[List[Tuple[str, str]]]:
+        """workbook.xml の <sheet> から (シート名, r:id) を取得
+
+        ツリー全体は構築せず iterparse で読み、</sheets> に達した時点で打ち切る
+        （後続の definedNames や calcPr は読まない）。
+        """
+        relative_path = 'xl/workbook.xml'
+        if relative_path not in self.names:
+            return None
+
+        rid_attr = f"{{{NS['r']}}}id"
+        sheets = []
+        try:
+            with self._open_member(relative_path) as fp:
+                for _, elem in ET.iterparse(fp, events=('end',)):
+                    if elem.tag == TAG_SHEET:
+                        sheets.append((elem.get('name', ''), elem.get(rid_attr)))
+                        elem.clear()
+                    elif elem.tag == TAG_SHEETS:
+                        break
+        except ET.ParseError as e:
+            print(f"XML Parse Error in {relative_path}: {e}")
+            return None
+        return sheets
+
+    def get_sheet_path(self, name: str) -> Optional[str]:
+        """シート名から ZIP 内のパスを取得"""
+        self.get_sheet_names()
+        return self._sheet_paths.get(name)
 
-    def get_sheet_xml(self, sheet_index: int) -> Optional[ET.Element]:
+    def get_sheet_by_name(self, name: str) -> Optional[ET.Element]:
         """シートのXMLを取得"""
-        return self.read_xml(f'xl/worksheets/sheet{sheet_index + 1}.xml')
+        relative_path = self.get_sheet_path(name)
+        if relative_path is None:
+            return None
+        return self.read_xml(relative_path)
+
+    def scan_sheet(self, name: str) -> Optional[List[CellRecord]]:
+        """sheetData のセルを iterparse で1回だけ走査し、セル情報の一覧を返す
+
+        結果はシートごとにキャッシュし、複数の検証関数で共有する。
+        """
+        if name in self._cell_cache:
+            return self._cell_cache[name]
+
+        relative_path = self.get_sheet_path(name)
+        if relative_path is None or relative_path not in self.names:
+            self._cell_cache[name] = None
+            return None
+
+        records: Optional[List[CellRecord]]
+        try:
+            with self._open_member(relative_path) as fp:
+                records = _scan_cells(fp, self.get_shared_strings())
+        except ET.ParseError as e:
+            print(f"XML Parse Error in {relative_path}: {e}")
+            records = None
+
+        self._cell_cache[name] = records
+        return records
+
+    def get_sheet_facts(self, name: str) -> Optional[SheetFacts]:
+        """シートの集計結果を取得（シートごとにキャッシュ）"""
+        if name not in self._facts_cache:
+            cells = self.scan_sheet(name)
+            self._facts_cache[name] = (
+                _collect_sheet_facts(cells) if cells is not None else None
+            )
+        return self._facts_cache[name]
+
+    def get_shared_strings(self) -> List[str]:
+        """共有文字列テーブル（sharedStrings.xml）の文字列一覧を取得（ない場合は空）
+
+        <si> の文字列は直下の <t>、リッチテキストでは各 <r>/<t> を連結したもの。
+        """
+        if self._shared_strings is None:
+            strings = []
+            sst = self.read_xml(SHARED_STRINGS_PATH)
+            if sst is not None:
+                for si in sst.iterfind(TAG_SI):
+                    t = si.find(TAG_T)
+                    if t is not None:
+                        strings.append(t.text or '')
+                    else:
+                        strings.append(''.join(run.findtext(TAG_T) or '' for run in si.iterfind(TAG_R)))
+            self._shared_strings = strings
+        return self._shared_strings
 
     def get_styles(self) -> Optional[ET.Element]:
         """styles.xmlを取得"""
@@ -113,12 +512,13 @@ def validate_file_structure(validator: XlsxValidator) -> TestReport:
         'xl/styles.xml',
     ]
 
+    # ZIP の中央ディレクトリから得た名前集合との差分で判定する
+    missing = set(required_files) - validator.names
     for f in required_files:
-        path = validator.extracted_path / f
-        if path.exists():
-            results.append(ValidationResult(True, f"必須ファイル存在: {f}"))
-        else:
+        if f in missing:
             results.append(ValidationResult(False, f"必須ファイル不足: {f}"))
+        else:
+            results.append(ValidationResult(True, f"必須ファイル存在: {f}"))
 
     return TestReport("ファイル構造検証", results)
 
@@ -156,10 +556,9 @@ def validate_styles(validator: XlsxValidator) -> TestReport:
         return TestReport("スタイル検証", results)
 
     # フォントの検証
-    fonts = styles.findall('.//main:font', NS)
     font_names = []
-    for font in fonts:
-        name_elem = font.find('main:name', NS)
+    for font in styles.iterfind(XP_FONT):
+        name_elem = font.find(XP_FONT_NAME)
         if name_elem is not None:
             font_names.append(name_elem.get('val', ''))
 
@@ -168,16 +567,20 @@ def validate_styles(validator: XlsxValidator) -> TestReport:
     else:
         results.append(ValidationResult(False, f"Meiryo UIフォント未使用 (fonts: {font_names})"))
 
-    # 塗りつぶしの検証 (ヘッダー色 #2C3E50)
-    fills = styles.findall('.//main:fill', NS)
+    # 塗りつぶしの検証 (ヘッダー色 #2C3E50 / 入力セル用の薄い青色) を1回の走査で行う
     has_header_fill = False
-    for fill in fills:
-        fg_color = fill.find('.//main:fgColor', NS)
-        if fg_color is not None:
-            color = fg_color.get('rgb', '').upper()
-            if '2C3E50' in color:
-                has_header_fill = True
-                break
+    has_input_fill = False
+    for fill in styles.iterfind(XP_FILL):
+        fg_color = fill.find(XP_FG_COLOR)
+        if fg_color is None:
+            continue
+        color = fg_color.get('rgb', '').upper()
+        if '2C3E50' in color:
+            has_header_fill = True
+        if 'EAF2F8' in color or 'D5E8F7' in color:
+            has_input_fill = True
+        if has_header_fill and has_input_fill:
+            break
 
     if has_header_fill:
         results.append(ValidationResult(True, "ヘッダー背景色 #2C3E50 使用"))
@@ -185,22 +588,13 @@ def validate_styles(validator: XlsxValidator) -> TestReport:
         results.append(ValidationResult(False, "ヘッダー背景色 #2C3E50 未使用"))
 
     # 入力セル用の薄い青色の確認
-    has_input_fill = False
-    for fill in fills:
-        fg_color = fill.find('.//main:fgColor', NS)
-        if fg_color is not None:
-            color = fg_color.get('rgb', '').upper()
-            if 'EAF2F8' in color or 'D5E8F7' in color:
-                has_input_fill = True
-                break
-
     if has_input_fill:
         results.append(ValidationResult(True, "入力セル背景色（薄青）使用"))
     else:
         results.append(ValidationResult(False, "入力セル背景色（薄青）未使用"))
 
     # cellXfsの数を確認
-    cell_xfs = styles.find('.//main:cellXfs', NS)
+    cell_xfs = styles.find(XP_CELLXFS)
     if cell_xfs is not None:
         xf_count = int(cell_xfs.get('count', '0'))
         if xf_count >= 5:
@@ -209,7 +603,7 @@ def validate_styles(validator: XlsxValidator) -> TestReport:
             results.append(ValidationResult(False, f"セルスタイル数不足: {xf_count}"))
 
     # 条件付き書式（dxfs）の検証
-    dxfs = styles.find('.//main:dxfs', NS)
+    dxfs = styles.find(XP_DXFS)
     if dxfs is not None:
         dxf_count = int(dxfs.get('count', '0'))
         if dxf_count >= 4:
@@ -230,17 +624,16 @@ def validate_template_sheet(validator: XlsxValidator) -> TestReport:
         results.append(ValidationResult(False, "Templateシートが存在しない"))
         return TestReport("Templateシート検証", results)
 
-    template_idx = sheet_names.index('Template')
-    sheet = validator.get_sheet_xml(template_idx)
+    sheet = validator.get_sheet_by_name('Template')
 
     if sheet is None:
         results.append(ValidationResult(False, "Templateシート読み込み失敗"))
         return TestReport("Templateシート検証", results)
 
     # 列幅の設定確認
-    cols = sheet.find('.//main:cols', NS)
+    cols = sheet.find(XP_COLS)
     if cols is not None:
-        col_count = len(cols.findall('main:col', NS))
+        col_count = sum(1 for _ in cols.iterfind(XP_COL))
         if col_count >= 5:
             results.append(ValidationResult(True, f"列幅設定数: {col_count}"))
         else:
@@ -249,7 +642,7 @@ def validate_template_sheet(validator: XlsxValidator) -> TestReport:
         results.append(ValidationResult(False, "列幅設定なし"))
 
     # フリーズペインの確認
-    pane = sheet.find('.//main:pane', NS)
+    pane = sheet.find(XP_PANE)
     if pane is not None:
         x_split = pane.get('xSplit', '0')
         y_split = pane.get('ySplit', '0')
@@ -262,22 +655,10 @@ def validate_template_sheet(validator: XlsxValidator) -> TestReport:
         results.append(ValidationResult(False, "フリーズペイン設定なし"))
 
     # ヘッダー行（4行目）の確認
-    sheet_data = sheet.find('.//main:sheetData', NS)
-    if sheet_data is not None:
-        rows = sheet_data.findall('main:row', NS)
-        row4 = None
-        for row in rows:
-            if row.get('r') == '4':
-                row4 = row
-                break
-
-        if row4 is not None:
-            cells = row4.findall('main:c', NS)
-            header_cells = []
-            for cell in cells:
-                inline_str = cell.find('.//main:t', NS)
-                if inline_str is not None:
-                    header_cells.append(inline_str.text)
+    facts = validator.get_sheet_facts('Template')
+    if facts is not None:
+        if facts.row4_texts:
+            header_cells = facts.row4_texts
 
             expected_headers = ['Lv', 'タスク名', '担当', '開始日', '工数', '終了日', '進捗率', 'ステータス']
             found_headers = []
@@ -295,7 +676,7 @@ def validate_template_sheet(validator: XlsxValidator) -> TestReport:
             results.append(ValidationResult(False, "ヘッダー行(4行目)が見つからない"))
 
     # 条件付き書式の確認
-    cf = sheet.findall('.//main:conditionalFormatting', NS)
+    cf = sheet.findall(XP_CF)
     if len(cf) >= 2:
         results.append(ValidationResult(True, f"条件付き書式セクション数: {len(cf)}"))
     else:
@@ -306,7 +687,7 @@ def validate_template_sheet(validator: XlsxValidator) -> TestReport:
     status_rules = 0
     for cf_section in cf:
         sqref = cf_section.get('sqref', '')
-        rules = cf_section.findall('main:cfRule', NS)
+        rules = cf_section.findall(XP_CF_RULE)
 
         # ガントチャート範囲 (K列以降)
         if sqref and ('K5' in sqref or 'K5:' in sqref):
@@ -326,14 +707,14 @@ def validate_template_sheet(validator: XlsxValidator) -> TestReport:
         results.append(ValidationResult(False, f"ステータス条件付き書式不足: {status_rules}ルール"))
 
     # シート保護の確認
-    protection = sheet.find('.//main:sheetProtection', NS)
+    protection = sheet.find(XP_SHEET_PROTECTION)
     if protection is not None:
         results.append(ValidationResult(True, "シート保護設定あり"))
     else:
         results.append(ValidationResult(False, "シート保護設定なし"))
 
     # データバリデーションの確認
-    dv = sheet.find('.//main:dataValidations', NS)
+    dv = sheet.find(XP_DATA_VALIDATIONS)
     if dv is not None:
         dv_count = int(dv.get('count', '0'))
         if dv_count >= 1:
@@ -355,31 +736,38 @@ def validate_config_sheet(validator: XlsxValidator) -> TestReport:
         results.append(ValidationResult(False, "Configシートが存在しない"))
         return TestReport("Configシート検証", results)
 
-    config_idx = sheet_names.index('Config')
-    sheet = validator.get_sheet_xml(config_idx)
+    sheet = validator.get_sheet_by_name('Config')
 
     if sheet is None:
         results.append(ValidationResult(False, "Configシート読み込み失敗"))
         return TestReport("Configシート検証", results)
 
     # 必須項目の確認
-    sheet_data = sheet.find('.//main:sheetData', NS)
+    sheet_data = sheet.find(XP_SHEET_DATA)
     if sheet_data is None:
         results.append(ValidationResult(False, "sheetDataなし"))
         return TestReport("Configシート検証", results)
 
-    # 全セルのテキストを収集
-    all_text = []
-    for row in sheet_data.findall('main:row', NS):
-        for cell in row.findall('main:c', NS):
-            t = cell.find('.//main:t', NS)
-            if t is not None and t.text:
-                all_text.append(t.text)
+    # 必須ラベルを探し、すべて見つかった時点で走査を打ち切る
+    required_labels = ['祝日リスト', '担当者リスト', 'ステータスリスト']
+    missing = set(required_labels)
+    shared_strings = validator.get_shared_strings()
+    for row in sheet_data.iterfind(TAG_ROW):
+        texts = []
+        for cell in row.iterfind(TAG_C):
+            text = find_cell_text(cell, shared_strings)
+            if text:
+                texts.append(text)
+        # 行内のテキストを区切り文字で連結し、ラベルごとに1回の部分文字列検索で判定する
+        # （\u0001 はセル境界をまたぐ誤検出を防ぐ）
+        joined = '\u0001'.join(texts)
+        missing = {label for label in missing if label not in joined}
+        if not missing:
+            break
 
     # 必須ラベルの確認
-    required_labels = ['祝日リスト', '担当者リスト', 'ステータスリスト']
     for label in required_labels:
-        found = any(label in text for text in all_text)
+        found = label not in missing
         if found:
             results.append(ValidationResult(True, f"必須ラベル存在: {label}"))
         else:
@@ -397,46 +785,39 @@ def validate_formulas(validator: XlsxValidator) -> TestReport:
         results.append(ValidationResult(False, "Templateシートが存在しない"))
         return TestReport("数式検証", results)
 
-    template_idx = sheet_names.index('Template')
-    sheet = validator.get_sheet_xml(template_idx)
+    facts = validator.get_sheet_facts('Template')
 
-    if sheet is None:
+    if facts is None:
         results.append(ValidationResult(False, "Templateシート読み込み失敗"))
         return TestReport("数式検証", results)
 
-    # 数式を収集
-    formulas = []
-    sheet_data = sheet.find('.//main:sheetData', NS)
-    if sheet_data is not None:
-        for row in sheet_data.findall('main:row', NS):
-            for cell in row.findall('main:c', NS):
-                f = cell.find('main:f', NS)
-                if f is not None and f.text:
-                    formulas.append((cell.get('r', ''), f.text))
+    formulas = facts.formulas
+    # 全数式を改行区切りで連結し、関数名の有無は部分文字列検索1回ずつで判定する
+    joined = '\n'.join(text for _, text in formulas)
 
     # 終了日計算（WORKDAY関数）
-    workday_found = any('WORKDAY' in f[1] for f in formulas)
+    workday_found = 'WORKDAY' in joined
     if workday_found:
         results.append(ValidationResult(True, "WORKDAY関数使用"))
     else:
         results.append(ValidationResult(False, "WORKDAY関数未使用"))
 
     # ステータス自動計算（IFS関数）
-    ifs_found = any('IFS' in f[1] for f in formulas)
+    ifs_found = 'IFS' in joined
     if ifs_found:
         results.append(ValidationResult(True, "IFS関数使用（ステータス自動計算）"))
     else:
         results.append(ValidationResult(False, "IFS関数未使用"))
 
     # 全体進捗計算（LET関数またはSUMPRODUCT）
-    progress_found = any('LET' in f[1] or 'SUMPRODUCT' in f[1] for f in formulas)
+    progress_found = 'LET' in joined or 'SUMPRODUCT' in joined
     if progress_found:
         results.append(ValidationResult(True, "全体進捗計算数式あり"))
     else:
         results.append(ValidationResult(False, "全体進捗計算数式なし"))
 
     # TODAY関数（ガント基準日）
-    today_found = any('TODAY' in f[1] for f in formulas)
+    today_found = 'TODAY' in joined
     if today_found:
         results.append(ValidationResult(True, "TODAY関数使用"))
     else:
@@ -460,37 +841,23 @@ def validate_cell_styles_applied(validator: XlsxValidator) -> TestReport:
         results.append(ValidationResult(False, "Templateシートが存在しない"))
         return TestReport("セルスタイル適用検証", results)
 
-    template_idx = sheet_names.index('Template')
-    sheet = validator.get_sheet_xml(template_idx)
+    facts = validator.get_sheet_facts('Template')
 
-    if sheet is None:
+    if facts is None:
         results.append(ValidationResult(False, "Templateシート読み込み失敗"))
         return TestReport("セルスタイル適用検証", results)
 
-    # スタイル適用状況を収集
-    style_usage = {}
-    sheet_data = sheet.find('.//main:sheetData', NS)
-    if sheet_data is not None:
-        for row in sheet_data.findall('main:row', NS):
-            for cell in row.findall('main:c', NS):
-                s = cell.get('s', '0')
-                style_usage[s] = style_usage.get(s, 0) + 1
+    style_usage = facts.style_usage
 
     # スタイル0以外が使われているか
-    non_default_styles = {k: v for k, v in style_usage.items() if k != '0'}
-    if non_default_styles:
-        results.append(ValidationResult(True, f"カスタムスタイル使用: {len(non_default_styles)}種類"))
+    non_default_count = len(style_usage.keys() - {'0'})
+    if non_default_count:
+        results.append(ValidationResult(True, f"カスタムスタイル使用: {non_default_count}種類"))
     else:
         results.append(ValidationResult(False, "カスタムスタイル未使用（すべてデフォルト）"))
 
     # ヘッダー行（4行目）のスタイル確認
-    row4_styles = set()
-    if sheet_data is not None:
-        for row in sheet_data.findall('main:row', NS):
-            if row.get('r') == '4':
-                for cell in row.findall('main:c', NS):
-                    s = cell.get('s', '0')
-                    row4_styles.add(s)
+    row4_styles = facts.row4_styles
 
     if len(row4_styles) > 0 and '0' not in row4_styles:
         results.append(ValidationResult(True, f"ヘッダー行スタイル適用: {row4_styles}"))
@@ -500,14 +867,7 @@ def validate_cell_styles_applied(validator: XlsxValidator) -> TestReport:
         results.append(ValidationResult(False, f"ヘッダー行スタイル問題: {row4_styles}"))
 
     # 入力セル（5行目以降）のスタイル確認
-    input_styles = set()
-    if sheet_data is not None:
-        for row in sheet_data.findall('main:row', NS):
-            row_num = int(row.get('r', '0'))
-            if row_num >= 5:
-                for cell in row.findall('main:c', NS):
-                    s = cell.get('s', '0')
-                    input_styles.add(s)
+    input_styles = facts.input_styles
 
     if input_styles and ('3' in input_styles or '9' in input_styles):
         results.append(ValidationResult(True, f"入力セルスタイル適用: {input_styles}"))
@@ -527,57 +887,25 @@ def validate_date_values(validator: XlsxValidator) -> TestReport:
     sheet_names = validator.get_sheet_names()
 
     # PRJ_001 シートを優先して検証（サンプルデータがある）
-    target_sheet = None
+    facts = None
     target_name = None
     for name in ['PRJ_001', 'Template']:
         if name in sheet_names:
             target_name = name
-            target_sheet = validator.get_sheet_xml(sheet_names.index(name))
+            facts = validator.get_sheet_facts(name)
             break
 
-    if target_sheet is None:
+    if facts is None:
         results.append(ValidationResult(False, "PRJ_001またはTemplateシートが存在しない"))
         return TestReport("日付値検証", results)
 
-    sheet = target_sheet
-
-    if sheet is None:
-        results.append(ValidationResult(False, f"{target_name}シート読み込み失敗"))
-        return TestReport("日付値検証", results)
-
     results.append(ValidationResult(True, f"検証対象シート: {target_name}"))
 
     # D列（開始日）の値を確認
-    date_cells = []
-    sheet_data = sheet.find('.//main:sheetData', NS)
-    if sheet_data is not None:
-        for row in sheet_data.findall('main:row', NS):
-            row_num = int(row.get('r', '0'))
-            if row_num >= 5:  # データ行
-                for cell in row.findall('main:c', NS):
-                    cell_ref = cell.get('r', '')
-                    if cell_ref.startswith('D'):
-                        v = cell.find('main:v', NS)
-                        inline_str = cell.find('.//main:t', NS)
-
-                        if v is not None:
-                            try:
-                                val = float(v.text)
-                                if 40000 < val < 50000:  # Excel日付範囲
-                                    date_cells.append((cell_ref, 'numeric', val))
-                                else:
-                                    date_cells.append((cell_ref, 'numeric_other', val))
-                            except (ValueError, TypeError):
-                                date_cells.append((cell_ref, 'text', v.text))
-                        elif inline_str is not None and inline_str.text:
-                            # 空のinline_stringは無視（スタイルのみのセル）
-                            date_cells.append((cell_ref, 'inline_string', inline_str.text))
-
-    numeric_dates = [d for d in date_cells if d[1] == 'numeric']
-    string_dates = [d for d in date_cells if d[1] in ('text', 'inline_string')]
-
-    if numeric_dates:
-        results.append(ValidationResult(True, f"数値形式の日付: {len(numeric_dates)}セル"))
+    string_dates = facts.string_dates
+
+    if facts.numeric_date_count:
+        results.append(ValidationResult(True, f"数値形式の日付: {facts.numeric_date_count}セル"))
     else:
         results.append(ValidationResult(False, "数値形式の日付なし"))
 
@@ -606,6 +934,33 @@ def run_all_validations(xlsx_path: str) -> List[TestReport]:
     return reports
 
 
+def run_all_validations_batch(xlsx_paths: List[str], workers: Optional[int] = None) -> Dict[str, List[TestReport]]:
+    """複数ファイルの検証をプロセスプールで並列実行する
+
+    ファイルごとの検証は互いに独立しているため、CPU コア数まで並列化する。
+    戻り値は入力順のパス → レポート一覧。
+    """
+    max_workers = workers or min(len(xlsx_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(xlsx_paths, executor.map(run_all_validations, xlsx_paths)))
+
+
+def test_shared_strings_build():
+    """--shared-strings で生成したブックも既定のブックと同じ検証に合格すること"""
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'tools'))
+    from build_workbook import build_workbook
+
+    with tempfile.TemporaryDirectory() as tmp:
+        xlsx_path = Path(tmp) / 'shared_strings.xlsx'
+        build_workbook(2, True, False, xlsx_path, shared_strings=True)
+        with zipfile.ZipFile(xlsx_path) as zf:
+            assert SHARED_STRINGS_PATH in zf.namelist()
+        reports = run_all_validations(str(xlsx_path))
+
+    failed = [(report.test_name, result.message) for report in reports for result in report.results if not result.passed]
+    assert not failed, failed
+
+
 def print_report(reports: List[TestReport]):
     """レポートを出力"""
     total_passed = 0
@@ -645,18 +1000,24 @@ def print_report(reports: List[TestReport]):
 def main():
     if len(sys.argv) < 2:
         # デフォルトのパス
-        xlsx_path = '/home/ec2-user/workspace/SUPER-WBS-IN-EXCEL/output/ModernExcelPMS.xlsx'
+        xlsx_paths = ['/home/ec2-user/workspace/SUPER-WBS-IN-EXCEL/output/ModernExcelPMS.xlsx']
     else:
-        xlsx_path = sys.argv[1]
+        xlsx_paths = sys.argv[1:]
 
-    if not os.path.exists(xlsx_path):
-        print(f"Error: File not found: {xlsx_path}")
-        sys.exit(1)
+    for xlsx_path in xlsx_paths:
+        if not os.path.exists(xlsx_path):
+            print(f"Error: File not found: {xlsx_path}")
+            sys.exit(1)
 
-    print(f"検証対象: {xlsx_path}")
+    if len(xlsx_paths) > 1:
+        all_reports = run_all_validations_batch(xlsx_paths)
+    else:
+        all_reports = {xlsx_paths[0]: run_all_validations(xlsx_paths[0])}
 
-    reports = run_all_validations(xlsx_path)
-    success = print_report(reports)
+    success = True
+    for xlsx_path, reports in all_reports.items():
+        print(f"検証対象: {xlsx_path}")
+        success = print_report(reports) and success
 
     sys.exit(0 if success else 1)
 
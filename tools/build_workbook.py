@@ -5,21 +5,42 @@ Modern Excel PMS の雛形ブックを自動生成するスクリプト。
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import Counter
+from collections.abc import Hashable
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 import argparse
-from datetime import datetime
+import io
+from datetime import date, datetime
+import logging
+import re
+from functools import lru_cache, partial, reduce
+from itertools import chain, groupby
+from operator import attrgetter, itemgetter, xor
 import os
 import sys
+import time
 from pathlib import Path
-from typing import List, Mapping, Sequence, Tuple
-from xml.sax.saxutils import escape
+from types import MappingProxyType
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Mapping, Sequence, Tuple
 import zipfile
+import zlib
+
+# ISA-L（python-isal）があれば Deflate 圧縮に使う（任意依存。なければ標準の zlib）
+try:
+    from isal import isal_zlib
+    ISAL_AVAILABLE = True
+except ImportError:
+    ISAL_AVAILABLE = False
 
 # toolsディレクトリをパスに追加
 TOOLS_DIR = Path(__file__).resolve().parent
 if str(TOOLS_DIR) not in sys.path:
     sys.path.insert(0, str(TOOLS_DIR))
 
+logger = logging.getLogger(__name__)
+
 OUTPUT_PATH = Path(__file__).resolve().parent.parent / "ModernExcelPMS.xlsm"
 VBA_SOURCE_DIR = Path(__file__).resolve().parent.parent / "docs" / "vba"
 
@@ -32,43 +53,89 @@ def get_sheet_password() -> str:
     return os.environ.get("PMS_SHEET_PASSWORD", DEFAULT_SHEET_PASSWORD)
 
 
+# ZIP の Deflate 圧縮レベル（環境変数 PMS_ZIP_LEVEL で上書き可能）
+# 繰り返しの多い XML はレベル 1 でも十分に縮み、既定の 6 より大幅に速い
+DEFAULT_ZIP_COMPRESS_LEVEL = 1
+
+
+def get_zip_compress_level() -> int:
+    """環境変数から圧縮レベル（0〜9）を取得、未設定・不正な値の場合はデフォルトを返す。"""
+    value = os.environ.get("PMS_ZIP_LEVEL", "")
+    if value.isdigit() and 0 <= int(value) <= 9:
+        return int(value)
+    if value:
+        logger.warning("⚠️  警告: PMS_ZIP_LEVEL=%s は 0〜9 ではないため無視します", value)
+    return DEFAULT_ZIP_COMPRESS_LEVEL
+
+
+# Excel のシート保護パスワードは最大 15 文字
+_PASSWORD_MAX_LENGTH = 15
+# 位置 i（1 始まり）のバイト値 b を (b << i) して 15 ビット左ローテートした値の表。
+# _PASSWORD_ROT[i][b] で引けるので、Latin-1 のパスワードはシフト・マスクを行わずに XOR で畳み込める
+_PASSWORD_ROT: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple((((b << i) >> 15) & 1) | (((b << i) << 1) & 0x7FFF) for b in range(256))
+    for i in range(_PASSWORD_MAX_LENGTH + 1)
+)
+
+
+@lru_cache(maxsize=32)
 def excel_password_hash(password: str) -> str:
     """Excel 互換のパスワードハッシュを計算する（XOR ベース）。
 
     Excel 2003 以前のレガシー形式。sheetProtection の password 属性に使用。
+    同じパスワードで繰り返し呼ばれるため結果をキャッシュする。
     """
     if not password:
         return ""
 
     # Excel password hash algorithm
-    pwd_hash = 0
-    pwd_len = len(password)
-
-    for i, char in enumerate(password):
-        char_val = ord(char) << (i + 1)
-        # Rotate left
-        char_val = ((char_val >> 15) & 1) | ((char_val << 1) & 0x7FFF)
-        pwd_hash ^= char_val
+    # 各文字を (i + 1) ビット左シフトしてから 15 ビットで左ローテートし、全体を XOR で畳み込む
+    try:
+        # Latin-1 で表せるパスワードはバイト列にして反復する（要素が int なので ord が不要）
+        codes: Sequence[int] = password.encode("latin-1")
+    except UnicodeEncodeError:
+        # それ以外の文字を含む場合は従来どおりコードポイントを使う（ハッシュ値を変えないため）
+        codes = [ord(char) for char in password]
+    if isinstance(codes, bytes) and len(codes) <= _PASSWORD_MAX_LENGTH:
+        rotated: Iterable[int] = map(tuple.__getitem__, _PASSWORD_ROT[1:], codes)
+    else:
+        shifted = (code << i for i, code in enumerate(codes, start=1))
+        rotated = (((value >> 15) & 1) | ((value << 1) & 0x7FFF) for value in shifted)
+    pwd_hash = reduce(xor, rotated, 0)
 
-    pwd_hash ^= pwd_len
+    pwd_hash ^= len(password)
     pwd_hash ^= 0xCE4B
 
-    return format(pwd_hash, "X")
+    return f"{pwd_hash:X}"
 
 # 共有データセット（レポート生成とシート生成の両方で再利用する）
-HOLIDAYS = ["2024-01-01", "2024-02-12", "2024-04-29", "2024-05-03", "2024-05-04", "2024-05-05"]
-MEMBERS = ["PM_佐藤", "TL_田中", "DEV_鈴木", "EXT_山田", "EXT_山田"]
-STATUSES = ["未着手", "進行中", "遅延", "完了"]
-CASES = [("CASE-001", "新規システム導入プロジェクト")]
-MEASURES = [
+# 読み取り専用の入力なのでタプルで保持する（シート XML のキャッシュもこれが不変であることに依存する）
+HOLIDAYS = ("2024-01-01", "2024-02-12", "2024-04-29", "2024-05-03", "2024-05-04", "2024-05-05")
+MEMBERS = ("PM_佐藤", "TL_田中", "DEV_鈴木", "EXT_山田", "EXT_山田")
+STATUSES = ("未着手", "進行中", "遅延", "完了")
+CASES = (("CASE-001", "新規システム導入プロジェクト"),)
+MEASURES = (
     ("ME-001", "CASE-001", "要件定義・設計フェーズ", "2025-12-15", "PRJ_001"),
     ("ME-002", "CASE-001", "開発・テストフェーズ", "2026-01-06", "PRJ_002"),
-]
+)
 
 
-@dataclass
+def status_from_progress(progress: float) -> str:
+    """進捗率からステータスを判定する（簡易版）。"""
+    if progress >= 1.0:
+        return "完了"
+    elif progress > 0:
+        return "進行中"
+    else:
+        return "未着手"
+
+
+@dataclass(frozen=True, slots=True)
 class SampleTask:
-    """サンプルタスクのデータを保持する。"""
+    """サンプルタスクのデータを保持する。
+
+    slots=True でインスタンス辞書を持たせず、status は生成時に一度だけ計算する。
+    """
 
     lv: int
     name: str
@@ -76,16 +143,11 @@ class SampleTask:
     start_date: str
     effort: int
     progress: float  # 0.0 〜 1.0
+    status: str = field(init=False)
 
-    @property
-    def status(self) -> str:
-        """進捗率からステータスを判定する（簡易版）。"""
-        if self.progress >= 1.0:
-            return "完了"
-        elif self.progress > 0:
-            return "進行中"
-        else:
-            return "未着手"
+    def __post_init__(self) -> None:
+        # 進捗率から判定したステータス（frozen のため object.__setattr__ で設定）
+        object.__setattr__(self, "status", status_from_progress(self.progress))
 
 
 # サンプルタスクデータ（PRJ_001 に配置）
@@ -115,35 +177,61 @@ SAMPLE_TASKS: List[SampleTask] = [
 ]
 
 
+# Excel epoch: 1899-12-30 (Excelの1900年バグを考慮) の通日
+_EXCEL_EPOCH_ORD = date(1899, 12, 30).toordinal()
+
+
+@lru_cache(maxsize=4096)
 def date_to_excel_serial(date_str: str) -> int:
     """日付文字列をExcelシリアル値に変換する。
 
     Excelでは1900年1月1日を1とするシリアル値を使用。
     ただし1900年2月29日のバグがあるため、1900年3月1日以降は+1する。
+    同じ日付（祝日・開始日など）は繰り返し渡されるため結果をキャッシュする。
     """
-    from datetime import datetime
-    dt = datetime.strptime(date_str, "%Y-%m-%d")
-    # Excel epoch: 1899-12-30 (Excelの1900年バグを考慮)
-    excel_epoch = datetime(1899, 12, 30)
-    delta = dt - excel_epoch
-    return delta.days
+    try:
+        parsed = date.fromisoformat(date_str)
+    except ValueError:
+        # "2024-1-5" のようなゼロ埋めなしの表記は strptime で解釈する
+        parsed = datetime.strptime(date_str, "%Y-%m-%d").date()
+    return parsed.toordinal() - _EXCEL_EPOCH_ORD
+
+
+def summarize(tasks: Sequence[SampleTask]) -> Tuple[int, float, dict[str, int]]:
+    """タスクを1回だけ走査し、(総工数, 消化工数, ステータス別タスク数) を返す。"""
+    total_effort = 0
+    weighted_sum = 0
+    counts: dict[str, int] = dict.fromkeys(STATUSES, 0)
+    for task in tasks:
+        effort = task.effort
+        total_effort += effort
+        weighted_sum += effort * task.progress
+        # status は status_from_progress が返す STATUSES のいずれかなので存在確認は不要
+        counts[task.status] += 1
+    return total_effort, weighted_sum, counts
 
 
-def calculate_weighted_progress(tasks: List[SampleTask]) -> float:
-    """工数加重平均で進捗率を計算する。"""
-    total_effort = sum(t.effort for t in tasks)
+def weighted_progress(total_effort: int, weighted_sum: float) -> float:
+    """総工数と消化工数から工数加重平均の進捗率を求める。"""
     if total_effort == 0:
         return 0.0
-    return sum(t.effort * t.progress for t in tasks) / total_effort
+    return weighted_sum / total_effort
+
+
+def calculate_weighted_progress(tasks: List[SampleTask]) -> float:
+    """工数加重平均で進捗率を計算する。"""
+    total_effort, weighted_sum, _ = summarize(tasks)
+    return weighted_progress(total_effort, weighted_sum)
+
+
+# タスクから status を取り出す（map と組み合わせて C 実装のまま走査する）
+_TASK_STATUS = attrgetter("status")
 
 
 def count_by_status(tasks: List[SampleTask]) -> Mapping[str, int]:
-    """ステータス別のタスク数を集計する。"""
-    counts: dict[str, int] = {s: 0 for s in STATUSES}
-    for task in tasks:
-        status = task.status
-        if status in counts:
-            counts[status] += 1
+    """ステータス別のタスク数を集計する（該当なしのステータスも 0 件として含む）。"""
+    counts = Counter(dict.fromkeys(STATUSES, 0))
+    counts.update(map(_TASK_STATUS, tasks))
     return counts
 
 
@@ -158,8 +246,8 @@ class Formula:
             self.expr = self.expr[1:]
 
 
-def col_letter(index: int) -> str:
-    """列番号を Excel の列名に変換する。"""
+def _compute_col_letter(index: int) -> str:
+    """列番号を Excel の列名に変換する（都度計算版）。"""
     name = ""
     while index:
         index, remainder = divmod(index - 1, 26)
@@ -167,30 +255,51 @@ def col_letter(index: int) -> str:
     return name
 
 
-def cell_ref(row: int, col: int) -> str:
-    return f"{col_letter(col)}{row}"
+# 列名の事前計算テーブル（インデックス = 列番号、0 は空文字）。A〜AMJ の 1024 列分
+_COL_LETTERS: Tuple[str, ...] = tuple(_compute_col_letter(i) for i in range(1025))
+_COL_LETTER_BYTES: Tuple[bytes, ...] = tuple(name.encode("ascii") for name in _COL_LETTERS)
 
 
-def cell_xml(row: int, col: int, value, style_id: int = 0) -> str:
-    """セルの XML を生成する。
+# 1 文字の列名（A〜Z）。呼び出しの大半はこの範囲なので文字列の添字アクセスだけで返す
+_SINGLE_COL_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
-    Args:
-        style_id: 0=ロック（デフォルト）、1=ロック解除
 
-    空文字列の場合はスタイルのみ適用（値なし）。
-    """
-    ref = cell_ref(row, col)
-    style_attr = f' s="{style_id}"' if style_id else ""
-    if isinstance(value, Formula):
-        return f"<c r=\"{ref}\"{style_attr}><f>{escape(value.expr)}</f></c>"
-    if isinstance(value, str):
-        # 空文字列の場合はスタイルのみ適用（値なし）
-        if value == "":
-            return f"<c r=\"{ref}\"{style_attr}/>"
-        return f"<c r=\"{ref}\"{style_attr} t=\"inlineStr\"><is><t>{escape(value)}</t></is></c>"
-    if value is None:
-        return ""
-    return f"<c r=\"{ref}\"{style_attr}><v>{value}</v></c>"
+def col_letter(index: int) -> str:
+    """列番号を Excel の列名に変換する。"""
+    if 0 < index <= 26:
+        return _SINGLE_COL_LETTERS[index - 1]
+    if 0 <= index < len(_COL_LETTERS):
+        return _COL_LETTERS[index]
+    return _compute_col_letter(index)
+
+
+def cell_ref(row: int, col: int, _letters: Tuple[str, ...] = _COL_LETTERS) -> str:
+    # 列名テーブルはデフォルト引数で受け取り、グローバル参照を避ける
+    if 0 <= col < len(_letters):
+        return _letters[col] + str(row)
+    return _compute_col_letter(col) + str(row)
+
+
+# XML エスケープ用の変換テーブル（str.translate で 1 パス置換する）
+_XML_ESCAPE_TBL = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+# 属性値用（ダブルクォートも置換する）
+_XML_ATTR_ESCAPE_TBL = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def _xml_escape(text: str) -> str:
+    """要素テキスト用に &, <, > をエスケープする。"""
+    # 大半の値（PRJ_001, CASE-001, 担当者名など）は置換対象を含まないのでそのまま返す
+    # （str.translate は日本語を含む文字列だと 1 文字ずつテーブルを引くため、この事前判定の方が数倍速い）
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+    return text.translate(_XML_ESCAPE_TBL)
+
+
+def _xml_attr_escape(text: str) -> str:
+    """属性値用に &, <, >, " をエスケープする。"""
+    if "&" not in text and "<" not in text and ">" not in text and '"' not in text:
+        return text
+    return text.translate(_XML_ATTR_ESCAPE_TBL)
 
 
 @dataclass
@@ -217,6 +326,15 @@ class SheetProtection:
             attrs.append('insertRows="1"')  # 1=禁止
         return f"<sheetProtection {' '.join(attrs)}/>"
 
+    def to_bytes(self) -> bytes:
+        """<sheetProtection> 要素を UTF-8 の bytes で返す（同じ設定のシート間で共有する）。"""
+        return _sheet_protection_bytes(self.password_hash, self.allow_insert_rows)
+
+
+@lru_cache(maxsize=32)
+def _sheet_protection_bytes(password_hash: str, allow_insert_rows: bool) -> bytes:
+    return SheetProtection(password_hash, allow_insert_rows).to_xml().encode("utf-8")
+
 
 # XML 宣言（全 XML ファイルの先頭に付与）
 XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
@@ -279,27 +397,171 @@ def sheet_views_xml(
     )
 
 
+@lru_cache(maxsize=32)
+def _sheet_views_bytes(freeze_row: int, freeze_col: int, show_grid_lines: bool) -> bytes:
+    """worksheet_xml 用に sheet_views_xml の結果をエンコードしてキャッシュする（ASCII のみ）。"""
+    return sheet_views_xml(freeze_row, freeze_col, show_grid_lines=show_grid_lines).encode("ascii")
+
+
+# worksheet_xml でセルを並べ替え・行単位にまとめるためのキー
+_CELL_ROW = itemgetter(0)
+_CELL_COL = itemgetter(1)
+
+# worksheet_xml で使う UTF-8 エンコード済みの固定断片
+WORKSHEET_OPEN = (
+    XML_DECL
+    + '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+).encode("utf-8")
+ROW_OPEN_TMPL = b'<row r="%s">'
+ROW_END = b"</row>"
+CELL_OPEN = b'<c r="'
+CELL_STYLE = b'" s="'
+CELL_EMPTY_END = b'"/>'
+FORMULA_OPEN = b'"><f>'
+FORMULA_END = b"</f></c>"
+INLINE_STR_OPEN = b'" t="inlineStr"><is><t>'
+INLINE_STR_END = b"</t></is></c>"
+VALUE_OPEN = b'"><v>'
+VALUE_END = b"</v></c>"
+LEGACY_DRAWING_OPEN = b'<legacyDrawing r:id="'
+LEGACY_DRAWING_END = b'"/>'
+# スタイル ID ごとの ' s="n' 断片（styles_xml の cellXfs 数ぶん）
+_CELL_STYLE_ATTRS: Tuple[bytes, ...] = tuple(CELL_STYLE + str(i).encode("ascii") for i in range(11))
+# 列ごとの '<c r="AB' 断片（セル開始タグと列名を 1 回の書き込みで済ませる）
+_CELL_OPEN_COLS: Tuple[bytes, ...] = tuple(CELL_OPEN + name for name in _COL_LETTER_BYTES)
+
+
+# セル値の型ごとの出力処理。<c r="A1" s="n" までを書き込んだ後に呼ばれ、残りを write する
+def _emit_formula(write: Callable[[bytes], object], value: Formula) -> None:
+    write(FORMULA_OPEN)
+    write(_xml_escape(value.expr).encode("utf-8"))
+    write(FORMULA_END)
+
+
+def _emit_str(write: Callable[[bytes], object], value: str) -> None:
+    # 空文字列の場合はスタイルのみ適用（値なし）
+    if value == "":
+        write(CELL_EMPTY_END)
+    else:
+        write(INLINE_STR_OPEN)
+        write(_xml_escape(value).encode("utf-8"))
+        write(INLINE_STR_END)
+
+
+def _emit_number(write: Callable[[bytes], object], value: object) -> None:
+    write(VALUE_OPEN)
+    write(str(value).encode("utf-8"))
+    write(VALUE_END)
+
+
+def _emit_value(write: Callable[[bytes], object], value: object) -> None:
+    """テーブルにない型（str のサブクラス等）用のフォールバック。"""
+    if isinstance(value, Formula):
+        _emit_formula(write, value)
+    elif isinstance(value, str):
+        _emit_str(write, value)
+    else:
+        _emit_number(write, value)
+
+
+# type(value) をキーにしたディスパッチテーブル（isinstance の連鎖を 1 回の dict 参照に置き換える）
+_CELL_EMITTERS: dict[type, Callable[[Callable[[bytes], object], object], None]] = {
+    Formula: _emit_formula,
+    str: _emit_str,
+    int: _emit_number,
+    float: _emit_number,
+}
+
+
+def cell_xml(row: int, col: int, value, style_id: int = 0) -> str:
+    """セルの XML を生成する。
+
+    Args:
+        style_id: 0=ロック（デフォルト）、1=ロック解除
+
+    空文字列の場合はスタイルのみ適用（値なし）。
+    """
+    if value is None:
+        return ""
+    out = bytearray(CELL_OPEN)
+    # worksheet_xml と同じく、列名とスタイル属性は事前エンコード済みのテーブルから引く
+    out += _COL_LETTER_BYTES[col] if col < len(_COL_LETTER_BYTES) else col_letter(col).encode("ascii")
+    out += str(row).encode("ascii")
+    if style_id:
+        out += _CELL_STYLE_ATTRS[style_id] if style_id < len(_CELL_STYLE_ATTRS) else CELL_STYLE + str(style_id).encode("ascii")
+    _CELL_EMITTERS.get(type(value), _emit_value)(out.extend, value)
+    return out.decode("utf-8")
+
+
+# write_worksheet が出力先へまとめて書き出す単位（行の途中では書き出さない）
+WORKSHEET_FLUSH_SIZE = 64 * 1024
+
+
 def worksheet_xml(
     cells: Sequence[Tuple[int, int, object]],
-    data_validations: str | None = None,
-    conditional_formattings: Sequence[str] | None = None,
+    data_validations: str | bytes | None = None,
+    conditional_formattings: Sequence[str | bytes] | None = None,
     sheet_protection: SheetProtection | None = None,
-    unlocked_cells: set[Tuple[int, int]] | None = None,
+    unlocked_bits: Mapping[int, int] | None = None,
     legacy_drawing_rid: str | None = None,
     column_defs: Sequence[ColumnDef] | None = None,
     freeze_row: int = 0,
     freeze_col: int = 0,
     cell_styles: dict[Tuple[int, int], int] | None = None,
     show_grid_lines: bool = False,
-) -> str:
-    """ワークシート XML を生成する。
+) -> bytes:
+    """ワークシート XML を生成する（UTF-8 の bytes を返す）。
+
+    引数の意味は write_worksheet と同じ。キャッシュ・重複排除・事前圧縮のために bytes が必要な場合に使う。
+    """
+    buf = io.BytesIO()
+    write_worksheet(
+        buf,
+        cells,
+        data_validations=data_validations,
+        conditional_formattings=conditional_formattings,
+        sheet_protection=sheet_protection,
+        unlocked_bits=unlocked_bits,
+        legacy_drawing_rid=legacy_drawing_rid,
+        column_defs=column_defs,
+        freeze_row=freeze_row,
+        freeze_col=freeze_col,
+        cell_styles=cell_styles,
+        show_grid_lines=show_grid_lines,
+    )
+    return buf.getvalue()
+
+
+def write_worksheet(
+    fp: BinaryIO,
+    cells: Sequence[Tuple[int, int, object]],
+    data_validations: str | bytes | None = None,
+    conditional_formattings: Sequence[str | bytes] | None = None,
+    sheet_protection: SheetProtection | None = None,
+    unlocked_bits: Mapping[int, int] | None = None,
+    legacy_drawing_rid: str | None = None,
+    column_defs: Sequence[ColumnDef] | None = None,
+    freeze_row: int = 0,
+    freeze_col: int = 0,
+    cell_styles: dict[Tuple[int, int], int] | None = None,
+    show_grid_lines: bool = False,
+) -> None:
+    """ワークシート XML をバイナリファイル fp（ZipFile.open(..., "w") など）へ書き出す。
+
+    セルごとの文字列を積み上げて join するのではなく、エンコード済みの断片を
+    bytearray に直接書き込み、WORKSHEET_FLUSH_SIZE を超えるたびに行単位で fp へ書き出す。
+    シート全体を一度にメモリへ保持しない。
+
+    cells は (row, col) の行優先順で渡されることを想定する。入口で行番号だけをキーに安定ソートし、
+    行ごとに groupby でまとめてから列番号で安定ソートする（(row, col) のタプルキーを全セル分作らない）。同じ座標のセルが複数ある場合は後に渡したものが優先される。
 
     Args:
-        cells: (row, col, value) のセルデータ
-        data_validations: データ検証 XML
-        conditional_formattings: 条件付き書式 XML リスト
+        cells: (row, col, value) のセルデータ（行優先順）
+        data_validations: データ検証 XML（エンコード済み bytes も可）
+        conditional_formattings: 条件付き書式 XML リスト（エンコード済み bytes も可）
         sheet_protection: シート保護設定
-        unlocked_cells: ロック解除するセルの (row, col) セット（旧方式、cell_styles優先）
+        unlocked_bits: 行番号 → ロック解除する列のビットマスク（bit n = n 列目、旧方式、cell_styles優先）
         legacy_drawing_rid: VML描画への参照ID（ボタン用）
         column_defs: 列幅定義のリスト
         freeze_row: フリーズする行数（ヘッダー固定用）
@@ -307,60 +569,134 @@ def worksheet_xml(
         cell_styles: セル座標からスタイルIDへのマッピング
         show_grid_lines: グリッド線表示（デフォルト: False - Non-Excel Look）
     """
-    rows = {}
-    for row, col, value in cells:
-        rows.setdefault(row, {})[col] = value
+    # タプル全体で比較すると値の型が混在した重複座標で TypeError になるため座標のみをキーにする
+    ordered_cells = sorted(cells, key=_CELL_ROW)
 
-    unlocked = unlocked_cells or set()
-    styles_map = cell_styles or {}
+    # セルごとの属性参照を避けるため、辞書の get はローカル名に束縛しておく
+    unlocked_get = (unlocked_bits or {}).get
+    styles_get = (cell_styles or {}).get
 
-    xml_lines: List[str] = [
-        XML_DECL,
-        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
-        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">',
-    ]
+    out = bytearray(WORKSHEET_OPEN)
+    write = out.extend
 
     # シートビュー（フリーズペイン、グリッド線非表示）- 常に出力
-    xml_lines.append(sheet_views_xml(freeze_row, freeze_col, show_grid_lines=show_grid_lines))
+    write(_sheet_views_bytes(freeze_row, freeze_col, show_grid_lines))
 
     # 列幅定義
     if column_defs:
-        xml_lines.append(cols_xml(column_defs))
-
-    xml_lines.append("<sheetData>")
-
-    for row_idx in sorted(rows):
-        xml_lines.append(f'<row r="{row_idx}">')
-        for col_idx in sorted(rows[row_idx]):
-            # スタイルマップがあればそれを優先、なければ unlocked_cells で判定
-            if (row_idx, col_idx) in styles_map:
-                style_id = styles_map[(row_idx, col_idx)]
-            elif (row_idx, col_idx) in unlocked:
-                style_id = STYLE_UNLOCKED
+        write(cols_xml(column_defs).encode("ascii"))
+
+    write(b"<sheetData>")
+
+    cell_open_cols = _CELL_OPEN_COLS
+    table_size = len(cell_open_cols)
+    emitters_get = _CELL_EMITTERS.get
+    style_attrs = _CELL_STYLE_ATTRS
+    style_attr_size = len(style_attrs)
+
+    for row_idx, group in groupby(ordered_cells, key=_CELL_ROW):
+        if len(out) >= WORKSHEET_FLUSH_SIZE:
+            fp.write(out)
+            out.clear()
+        row_bytes = b"%d" % row_idx
+        write(ROW_OPEN_TMPL % row_bytes)
+        unlocked_mask = unlocked_get(row_idx, 0)
+        # 行内だけを列で並べ替える（安定ソートなので重複座標の相対順序は (row, col) での一括ソートと同じ）
+        row_cells = sorted(group, key=_CELL_COL)
+        last = len(row_cells) - 1
+        for pos, (_, col_idx, value) in enumerate(row_cells):
+            # 同じ座標が続く場合は最後のものだけを出力する
+            if pos < last and row_cells[pos + 1][1] == col_idx:
+                continue
+            if value is None:
+                continue
+            # スタイルマップがあればそれを優先、なければ unlocked_bits のビットで判定
+            style_id = styles_get((row_idx, col_idx))
+            if style_id is None:
+                style_id = STYLE_UNLOCKED if unlocked_mask >> col_idx & 1 else STYLE_LOCKED
+
+            # cell_xml と同じ出力をバイト列で直接書き込む
+            # （(型, スタイル) ごとの bytes テンプレートを % で埋める方式も試したが、断片ごとの extend より遅かった）
+            if col_idx < table_size:
+                write(cell_open_cols[col_idx])
             else:
-                style_id = STYLE_LOCKED
-            xml_lines.append(cell_xml(row_idx, col_idx, rows[row_idx][col_idx], style_id))
-        xml_lines.append("</row>")
-
-    xml_lines.append("</sheetData>")
+                write(CELL_OPEN)
+                write(col_letter(col_idx).encode("ascii"))
+            write(row_bytes)
+            if style_id:
+                if style_id < style_attr_size:
+                    write(style_attrs[style_id])
+                else:
+                    write(CELL_STYLE)
+                    write(str(style_id).encode("ascii"))
+            emitters_get(type(value), _emit_value)(write, value)
+        write(ROW_END)
+
+    write(b"</sheetData>")
 
     # OpenXML 仕様に従った要素順序:
     # sheetData → sheetProtection → conditionalFormatting → dataValidations → legacyDrawing
     if sheet_protection:
-        xml_lines.append(sheet_protection.to_xml())
+        write(sheet_protection.to_bytes())
 
     if conditional_formattings:
-        xml_lines.extend(conditional_formattings)
+        for cf in conditional_formattings:
+            write(cf if isinstance(cf, bytes) else cf.encode("utf-8"))
 
     if data_validations:
-        xml_lines.append(data_validations)
+        if isinstance(data_validations, str):
+            data_validations = data_validations.encode("utf-8")
+        write(data_validations)
 
     # VML描画（ボタン）への参照
     if legacy_drawing_rid:
-        xml_lines.append(f'<legacyDrawing r:id="{legacy_drawing_rid}"/>')
+        write(LEGACY_DRAWING_OPEN)
+        write(legacy_drawing_rid.encode("utf-8"))
+        write(LEGACY_DRAWING_END)
 
-    xml_lines.append("</worksheet>")
-    return "".join(xml_lines)
+    write(b"</worksheet>")
+    fp.write(out)
+
+
+# レンダリング済みシート XML 中のインライン文字列セルの末尾（<t> の中身はエスケープ済みなので "<" を含まない）
+_INLINE_STR_CELL = re.compile(rb' t="inlineStr"><is><t>([^<]*)</t></is></c>')
+
+
+@dataclass
+class SharedStrings:
+    """xl/sharedStrings.xml の共有文字列テーブル。
+
+    シートはキャッシュ・重複排除・並列生成のためにインライン文字列のまま生成し、
+    ZIP へ書き込む直前に convert でシート順に共有文字列への参照 (t="s") に置き換える。
+    同じ内容のシートは同じ結果に変換されるため、変換後の圧縮結果もそのまま使い回せる。
+    """
+
+    index: dict[bytes, int] = field(default_factory=dict)
+    count: int = 0
+
+    def intern(self, text: bytes) -> int:
+        """XML エスケープ済みの UTF-8 文字列を登録し、そのインデックスを返す。"""
+        self.count += 1
+        idx = self.index.get(text)
+        if idx is None:
+            idx = self.index[text] = len(self.index)
+        return idx
+
+    def _replace(self, match: re.Match[bytes]) -> bytes:
+        return b' t="s"><v>%d</v></c>' % self.intern(match.group(1))
+
+    def convert(self, sheet_xml: bytes) -> bytes:
+        """シート XML のインライン文字列セルを共有文字列への参照に置き換える。"""
+        return _INLINE_STR_CELL.sub(self._replace, sheet_xml)
+
+    def to_xml(self) -> bytes:
+        """sharedStrings.xml を生成する（UTF-8 の bytes を返す）。"""
+        head = (
+            XML_DECL + '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            f'count="{self.count}" uniqueCount="{len(self.index)}">'
+        ).encode("utf-8")
+        items = b"".join(b"<si><t>%s</t></si>" % text for text in self.index)
+        return head + items + b"</sst>"
 
 
 @dataclass
@@ -394,13 +730,13 @@ def vml_drawing_xml(buttons: Sequence[ButtonDefinition], sheet_name: str) -> str
  o:button="t" fillcolor="buttonFace [67]" strokecolor="windowText [64]" o:insetmode="auto">
  <v:fill color2="buttonFace [67]" o:detectmouseclick="t"/>
  <v:textbox style="mso-direction-alt:auto" o:singleclick="f">
-  <div style="text-align:center"><font face="Meiryo UI" size="160" color="#000000">{escape(btn.text or btn.name)}</font></div>
+  <div style="text-align:center"><font face="Meiryo UI" size="160" color="#000000">{_xml_escape(btn.text or btn.name)}</font></div>
  </v:textbox>
  <x:ClientData ObjectType="Button">
   <x:Anchor>{left_col}, 8, {top_row}, 6, {right_col}, 72, {bottom_row}, 2</x:Anchor>
   <x:PrintObject>False</x:PrintObject>
   <x:AutoFill>False</x:AutoFill>
-  <x:FmlaMacro>{escape(btn.macro_name)}</x:FmlaMacro>
+  <x:FmlaMacro>{_xml_escape(btn.macro_name)}</x:FmlaMacro>
   <x:TextHAlign>Center</x:TextHAlign>
   <x:TextVAlign>Center</x:TextVAlign>
  </x:ClientData>
@@ -422,7 +758,7 @@ def vml_drawing_xml(buttons: Sequence[ButtonDefinition], sheet_name: str) -> str
 </xml>'''
 
 
-def worksheet_rels_xml(vml_rid: str | None = None, vml_filename: str = "vmlDrawing1.vml") -> str | None:
+def worksheet_rels_xml(vml_rid: str | None = None, vml_filename: str = "vmlDrawing1.vml") -> bytes | None:
     """ワークシートのリレーションシップXMLを生成する。
 
     Args:
@@ -436,97 +772,327 @@ def worksheet_rels_xml(vml_rid: str | None = None, vml_filename: str = "vmlDrawi
         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
         f'<Relationship Id="{vml_rid}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/vmlDrawing" Target="../drawings/{vml_filename}"/>'
         "</Relationships>"
-    )
+    ).encode("utf-8")
+
+
+# [Content_Types].xml / _rels/.rels の不変部分（インポート時に一度だけエンコードする）
+_CONTENT_TYPES_HEAD = (
+    XML_DECL +
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+).encode("utf-8")
+_CONTENT_TYPES_VML_DEFAULT = b'<Default Extension="vml" ContentType="application/vnd.openxmlformats-officedocument.vmlDrawing"/>'
+_CONTENT_TYPES_WORKBOOK_XLSX = b'<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+_CONTENT_TYPES_WORKBOOK_XLSM = b'<Override PartName="/xl/workbook.xml" ContentType="application/vnd.ms-excel.sheet.macroEnabled.main+xml"/>'
+_CONTENT_TYPES_SHEET_TMPL = b'<Override PartName="/xl/worksheets/sheet%d.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+_CONTENT_TYPES_STYLES = b'<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+_CONTENT_TYPES_VBA = b'<Override PartName="/xl/vbaProject.bin" ContentType="application/vnd.ms-office.vbaProject"/>'
+_CONTENT_TYPES_SHARED_STRINGS = b'<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+_CONTENT_TYPES_TAIL = b"</Types>"
 
 
-def content_types_xml(sheet_count: int, has_vml: bool = False, has_vba: bool = False) -> str:
-    """[Content_Types].xml を生成する。
+@lru_cache(maxsize=32)
+def content_types_xml(sheet_count: int, has_vml: bool = False, has_vba: bool = False, has_shared_strings: bool = False) -> bytes:
+    """[Content_Types].xml を生成する（UTF-8 の bytes を返す）。
+
+    シート数に依存する Override 要素だけを組み立て、それ以外は事前エンコード済みの断片を連結する。
+    引数が同じなら結果も同じなので、プロセス内ではキャッシュを返す。
 
     Args:
         sheet_count: シート数
         has_vml: VML 描画を含むか
         has_vba: VBA プロジェクトを含むか
+        has_shared_strings: 共有文字列テーブル (sharedStrings.xml) を含むか
     """
-    overrides = "".join(
-        f'<Override PartName="/xl/worksheets/sheet{idx}.xml" '
-        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
-        for idx in range(1, sheet_count + 1)
-    )
-    vml_default = '<Default Extension="vml" ContentType="application/vnd.openxmlformats-officedocument.vmlDrawing"/>' if has_vml else ""
-
+    parts = [_CONTENT_TYPES_HEAD]
+    if has_vml:
+        parts.append(_CONTENT_TYPES_VML_DEFAULT)
     # マクロ有効ブック (.xlsm) か通常ブック (.xlsx) かでコンテンツタイプを切り替え
+    parts.append(_CONTENT_TYPES_WORKBOOK_XLSM if has_vba else _CONTENT_TYPES_WORKBOOK_XLSX)
+    parts.extend(_CONTENT_TYPES_SHEET_TMPL % idx for idx in range(1, sheet_count + 1))
+    parts.append(_CONTENT_TYPES_STYLES)
     if has_vba:
-        workbook_content_type = "application/vnd.ms-excel.sheet.macroEnabled.main+xml"
-        vba_override = '<Override PartName="/xl/vbaProject.bin" ContentType="application/vnd.ms-office.vbaProject"/>'
-    else:
-        workbook_content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"
-        vba_override = ""
-
-    return (
-        XML_DECL +
-        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
-        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
-        '<Default Extension="xml" ContentType="application/xml"/>'
-        f"{vml_default}"
-        f'<Override PartName="/xl/workbook.xml" ContentType="{workbook_content_type}"/>'
-        f"{overrides}"
-        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
-        f"{vba_override}"
-        "</Types>"
+        parts.append(_CONTENT_TYPES_VBA)
+    if has_shared_strings:
+        parts.append(_CONTENT_TYPES_SHARED_STRINGS)
+    parts.append(_CONTENT_TYPES_TAIL)
+    return b"".join(parts)
+
+
+ROOT_RELS_XML: bytes = (
+    XML_DECL +
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+).encode("utf-8")
+
+
+def root_rels_xml() -> bytes:
+    return ROOT_RELS_XML
+
+
+# xl/workbook.xml の不変部分
+_WORKBOOK_HEAD = (
+    XML_DECL +
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    "<sheets>"
+).encode("utf-8")
+_WORKBOOK_TAIL = b"</workbook>"
+
+
+def defined_names_xml(defined_names: Mapping[str, str]) -> bytes:
+    """<definedNames> 要素を生成する（UTF-8 の bytes を返す）。"""
+    if not defined_names:
+        return b""
+    body = "".join(
+        f'<definedName name="{_xml_attr_escape(name)}">{_xml_escape(ref)}</definedName>'
+        for name, ref in defined_names.items()
     )
+    return b"<definedNames>" + body.encode("utf-8") + b"</definedNames>"
 
 
-def root_rels_xml() -> str:
-    return (
-        XML_DECL +
-        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
-        "</Relationships>"
-    )
+# ブック全体で使う名前定義（固定なのでインポート時に一度だけエンコードする）
+WORKBOOK_DEFINED_NAMES: Mapping[str, str] = MappingProxyType({
+    "CaseIds": "Case_Master!$A$2:$A$100",
+    "MeasureList": "Measure_Master!$A$2:$H$104",
+    "CaseDrilldownArea": "Case_Master!$G$3:$N$104",
+})
+WORKBOOK_DEFINED_NAMES_XML: bytes = defined_names_xml(WORKBOOK_DEFINED_NAMES)
 
 
-def workbook_xml(sheet_names: Sequence[str], defined_names: Mapping[str, str] | None = None) -> str:
-    sheets_xml = "".join(
-        f'<sheet name="{escape(name)}" sheetId="{idx}" r:id="rId{idx}"/>'
+@lru_cache(maxsize=32)
+def _sheet_entries_xml(sheet_names: Tuple[str, ...]) -> bytes:
+    """<sheets> 内の <sheet> 要素列を生成する（シート名の並びが同じなら結果をキャッシュする）。"""
+    return "".join(
+        f'<sheet name="{_xml_attr_escape(name)}" sheetId="{idx}" r:id="rId{idx}"/>'
         for idx, name in enumerate(sheet_names, start=1)
-    )
+    ).encode("utf-8")
+
+
+def workbook_xml(sheet_names: Sequence[str], defined_names: Mapping[str, str] | bytes | None = None) -> bytes:
+    """xl/workbook.xml を生成する（UTF-8 の bytes を返す）。
+
+    固定部分はエンコード済みの断片を使い、シート名・名前定義だけをエンコードする。
+    defined_names に bytes を渡した場合は生成済みの <definedNames> 要素としてそのまま埋め込む。
+    """
+    parts = [_WORKBOOK_HEAD]
+    parts.append(_sheet_entries_xml(tuple(sheet_names)))
+    parts.append(b"</sheets>")
 
-    defined_names_xml = ""
     if defined_names:
-        defined_names_xml = "<definedNames>" + "".join(
-            f'<definedName name="{escape(name)}">{escape(ref)}</definedName>'
-            for name, ref in defined_names.items()
-        ) + "</definedNames>"
+        parts.append(defined_names if isinstance(defined_names, bytes) else defined_names_xml(defined_names))
 
-    return (
-        XML_DECL +
-        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
-        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
-        f"<sheets>{sheets_xml}</sheets>"
-        f"{defined_names_xml}"
-        "</workbook>"
-    )
+    parts.append(_WORKBOOK_TAIL)
+    return b"".join(parts)
 
 
-def workbook_rels_xml(sheet_count: int, has_vba: bool = False) -> str:
-    """xl/_rels/workbook.xml.rels を生成する。"""
-    rels = "".join(
-        f'<Relationship Id="rId{idx}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet{idx}.xml"/>'
-        for idx in range(1, sheet_count + 1)
-    )
-    rels += (
-        f'<Relationship Id="rId{sheet_count + 1}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
-    )
+# xl/_rels/workbook.xml.rels の不変部分
+_WORKBOOK_RELS_HEAD = (
+    XML_DECL + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+).encode("utf-8")
+_WORKBOOK_RELS_SHEET_TMPL = b'<Relationship Id="rId%d" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet%d.xml"/>'
+_WORKBOOK_RELS_STYLES_TMPL = b'<Relationship Id="rId%d" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+_WORKBOOK_RELS_VBA_TMPL = b'<Relationship Id="rId%d" Type="http://schemas.microsoft.com/office/2006/relationships/vbaProject" Target="vbaProject.bin"/>'
+_WORKBOOK_RELS_SHARED_STRINGS_TMPL = b'<Relationship Id="rId%d" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>'
+_WORKBOOK_RELS_TAIL = b"</Relationships>"
+
+
+@lru_cache(maxsize=32)
+def workbook_rels_xml(sheet_count: int, has_vba: bool = False, has_shared_strings: bool = False) -> bytes:
+    """xl/_rels/workbook.xml.rels を生成する（UTF-8 の bytes を返す）。"""
+    parts = [_WORKBOOK_RELS_HEAD]
+    parts.extend(_WORKBOOK_RELS_SHEET_TMPL % (idx, idx) for idx in range(1, sheet_count + 1))
+    parts.append(_WORKBOOK_RELS_STYLES_TMPL % (sheet_count + 1))
     if has_vba:
-        rels += (
-            f'<Relationship Id="rId{sheet_count + 2}" Type="http://schemas.microsoft.com/office/2006/relationships/vbaProject" Target="vbaProject.bin"/>'
+        parts.append(_WORKBOOK_RELS_VBA_TMPL % (sheet_count + 2))
+    if has_shared_strings:
+        parts.append(_WORKBOOK_RELS_SHARED_STRINGS_TMPL % (sheet_count + 2 + has_vba))
+    parts.append(_WORKBOOK_RELS_TAIL)
+    return b"".join(parts)
+
+
+@dataclass(frozen=True)
+class FontDef:
+    """styles.xml の <font> 定義（Meiryo UI 固定）。"""
+
+    size: int
+    bold: bool = False
+    italic: bool = False
+    color_rgb: str | None = None  # None の場合はテーマ色 1
+
+    def to_xml(self) -> str:
+        color = f'<color rgb="{self.color_rgb}"/>' if self.color_rgb else '<color theme="1"/>'
+        return (
+            f'<font>{"<b/>" if self.bold else ""}{"<i/>" if self.italic else ""}'
+            f'<sz val="{self.size}"/>{color}<name val="Meiryo UI"/><family val="2"/></font>'
+        )
+
+
+@dataclass(frozen=True)
+class FillDef:
+    """styles.xml の <fill> 定義。fg_rgb を指定した場合は単色塗りつぶし。"""
+
+    pattern: str = "solid"
+    fg_rgb: str | None = None
+
+    def to_xml(self) -> str:
+        if self.fg_rgb is None:
+            return f'<fill><patternFill patternType="{self.pattern}"/></fill>'
+        return (
+            f'<fill><patternFill patternType="{self.pattern}">'
+            f'<fgColor rgb="{self.fg_rgb}"/><bgColor indexed="64"/></patternFill></fill>'
+        )
+
+
+@dataclass(frozen=True)
+class CellXfDef:
+    """styles.xml の cellXfs 内の <xf> 定義。apply* 属性は既定値以外を指定した項目から導出する。"""
+
+    num_fmt_id: int = 0
+    font_id: int = 0
+    fill_id: int = 0
+    border_id: int = 0
+    alignment: str | None = None  # <alignment> の属性（例: 'horizontal="center"'）
+    locked: bool = True
+
+    def to_xml(self) -> str:
+        attrs = (
+            f'numFmtId="{self.num_fmt_id}" fontId="{self.font_id}" '
+            f'fillId="{self.fill_id}" borderId="{self.border_id}" xfId="0"'
         )
-    return XML_DECL + f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{rels}</Relationships>'
+        if self.num_fmt_id:
+            attrs += ' applyNumberFormat="1"'
+        if self.font_id:
+            attrs += ' applyFont="1"'
+        if self.fill_id:
+            attrs += ' applyFill="1"'
+        if self.border_id:
+            attrs += ' applyBorder="1"'
+        if self.alignment:
+            attrs += ' applyAlignment="1"'
+        if not self.locked:
+            attrs += ' applyProtection="1"'
+        children = ""
+        if self.alignment:
+            children += f"<alignment {self.alignment}/>"
+        if not self.locked:
+            children += '<protection locked="0"/>'
+        if not children:
+            return f"<xf {attrs}/>"
+        return f"<xf {attrs}>{children}</xf>"
+
+
+_CENTER = 'horizontal="center" vertical="center"'
+
+# フォント定義
+FONT_DEFS: Tuple[FontDef, ...] = (
+    FontDef(11),  # 0: 標準
+    FontDef(11, bold=True, color_rgb="FFFFFFFF"),  # 1: ヘッダー用（白太字）
+    FontDef(14, bold=True),  # 2: タイトル用
+    FontDef(11, bold=True),  # 3: サブヘッダー用（太字）
+    FontDef(9),  # 4: 小さいフォント
+    FontDef(10, italic=True, color_rgb="FF666666"),  # 5: 説明用（イタリック・グレー）
+)
+
+# 塗りつぶし定義（0, 1 は Excel が予約しているため常に残す）
+FILL_DEFS: Tuple[FillDef, ...] = (
+    FillDef("none"),  # 0: なし
+    FillDef("gray125"),  # 1: グレーパターン
+    FillDef(fg_rgb="FF2C3E50"),  # 2: ダークブルー（ヘッダー）
+    FillDef(fg_rgb="FFEAF2F8"),  # 3: 薄青（入力セル）
+    FillDef(fg_rgb="FFF5F5F5"),  # 4: 薄グレー（計算セル）
+    FillDef(fg_rgb="FFD5E8F7"),  # 5: 薄青（サブヘッダー）
+)
+
+# 罫線定義
+BORDER_DEFS: Tuple[str, ...] = (
+    '<border><left/><right/><top/><bottom/><diagonal/></border>',  # 0: なし
+    (  # 1: 薄い罫線（全方向）
+        '<border>'
+        '<left style="thin"><color indexed="64"/></left>'
+        '<right style="thin"><color indexed="64"/></right>'
+        '<top style="thin"><color indexed="64"/></top>'
+        '<bottom style="thin"><color indexed="64"/></bottom>'
+        '<diagonal/>'
+        '</border>'
+    ),
+    '<border><left/><right/><top/><bottom style="thin"><color indexed="64"/></bottom><diagonal/></border>',  # 2: 下線のみ
+    '<border><left/><right/><top/><bottom style="medium"><color rgb="FF2C3E50"/></bottom><diagonal/></border>',  # 3: 太い下線
+)
+
+# 数値フォーマット (numFmtId, formatCode)
+NUM_FMT_DEFS: Tuple[Tuple[int, str], ...] = (
+    (164, "yyyy/mm/dd"),  # 日付
+    (165, "0%"),  # パーセント
+)
+
+# セルフォーマット定義（インデックスが STYLE_* 定数と対応する）
+CELL_XF_DEFS: Tuple[CellXfDef, ...] = (
+    CellXfDef(),  # 0: 標準（ロック）
+    CellXfDef(locked=False),  # 1: ロック解除（編集可能）
+    CellXfDef(font_id=1, fill_id=2, border_id=1, alignment=_CENTER),  # 2: ヘッダー（青背景・白太字・罫線・中央揃え）
+    CellXfDef(fill_id=3, border_id=1, locked=False),  # 3: 入力セル（薄青背景・罫線・ロック解除）
+    CellXfDef(font_id=2),  # 4: タイトル（大きい太字）
+    CellXfDef(fill_id=4, border_id=1),  # 5: 計算セル（グレー背景・罫線）
+    CellXfDef(font_id=3, fill_id=5, border_id=1, alignment=_CENTER),  # 6: サブヘッダー（薄青背景・太字・罫線）
+    CellXfDef(num_fmt_id=164, font_id=4, border_id=2, alignment='horizontal="center"'),  # 7: 日付ヘッダー（小フォント・中央揃え・下線）
+    CellXfDef(font_id=5),  # 8: 説明テキスト（イタリック）
+    CellXfDef(num_fmt_id=165, fill_id=3, border_id=1, locked=False),  # 9: パーセント入力セル
+    CellXfDef(num_fmt_id=164, fill_id=3, border_id=1, locked=False),  # 10: 日付入力セル（薄青背景・日付フォーマット・罫線・ロック解除）
+)
+
+# 条件付き書式用スタイル（dxf）。インデックスが条件付き書式の dxfId と対応する
+DXF_DEFS: Tuple[str, ...] = (
+    '<dxf><border><right style="medium"><color rgb="FFE74C3C"/></right></border></dxf>',  # 0: 今日ライン
+    '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FF95A5A6"/><bgColor indexed="64"/></patternFill></fill></dxf>',  # 1: 完了（グレー）
+    '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FFE74C3C"/><bgColor indexed="64"/></patternFill></fill></dxf>',  # 2: 遅延（赤）
+    '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FF3498DB"/><bgColor indexed="64"/></patternFill></fill></dxf>',  # 3: 進行中（青）
+    '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FFECF0F1"/><bgColor indexed="64"/></patternFill></fill></dxf>',  # 4: 未着手（薄グレー）
+    '<dxf><font><color rgb="FFFFFFFF"/></font><fill><patternFill patternType="solid"><fgColor rgb="FF3498DB"/><bgColor indexed="64"/></patternFill></fill></dxf>',  # 5: 進行中ステータス
+    '<dxf><font><color rgb="FFFFFFFF"/></font><fill><patternFill patternType="solid"><fgColor rgb="FFE74C3C"/><bgColor indexed="64"/></patternFill></fill></dxf>',  # 6: 遅延ステータス
+    '<dxf><font><color rgb="FFFFFFFF"/></font><fill><patternFill patternType="solid"><fgColor rgb="FF27AE60"/><bgColor indexed="64"/></patternFill></fill></dxf>',  # 7: 完了ステータス
+    '<dxf><font><b/><color rgb="FFFFFFFF"/></font><fill><patternFill patternType="solid"><fgColor rgb="FF34495E"/><bgColor indexed="64"/></patternFill></fill></dxf>',  # 8: Lv1行（濃紺背景・白太字）
+    '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FFF39C12"/><bgColor indexed="64"/></patternFill></fill></dxf>',  # 9: 警告（オレンジ）- 未リンク
+    '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FFF1C40F"/><bgColor indexed="64"/></patternFill></fill></dxf>',  # 10: 警告（黄）- 範囲外
+)
+
+
+def _compact_style_tables(
+    fonts: Sequence[FontDef],
+    fills: Sequence[FillDef],
+    borders: Sequence[str],
+    cell_xfs: Sequence[CellXfDef],
+) -> Tuple[List[FontDef], List[FillDef], List[str], List[CellXfDef]]:
+    """どの cellXfs からも参照されないフォント・塗りつぶし・罫線を除き、ID を詰め直す。
+
+    cellXfs 自体は STYLE_* 定数とセルの s 属性から参照されるため、番号を変えずにそのまま残す。
+    """
+    used_fonts = sorted({0} | {xf.font_id for xf in cell_xfs})
+    # 塗りつぶし 0（none）と 1（gray125）は Excel の予約なので常に残す
+    used_fills = sorted({0, 1} | {xf.fill_id for xf in cell_xfs})
+    used_borders = sorted({0} | {xf.border_id for xf in cell_xfs})
+    font_ids = {old: new for new, old in enumerate(used_fonts)}
+    fill_ids = {old: new for new, old in enumerate(used_fills)}
+    border_ids = {old: new for new, old in enumerate(used_borders)}
+    compact_xfs = [
+        replace(xf, font_id=font_ids[xf.font_id], fill_id=fill_ids[xf.fill_id], border_id=border_ids[xf.border_id])
+        for xf in cell_xfs
+    ]
+    return (
+        [fonts[i] for i in used_fonts],
+        [fills[i] for i in used_fills],
+        [borders[i] for i in used_borders],
+        compact_xfs,
+    )
 
 
-def styles_xml() -> str:
+def _build_styles_xml() -> str:
     """スタイルシートを生成する。
 
+    FONT_DEFS などの定義表から組み立て、cellXfs から参照されない定義は出力しない。
+
     セルスタイル:
       - xfId=0: 標準（ロック）
       - xfId=1: ロック解除（編集可能セル用）
@@ -537,125 +1103,39 @@ def styles_xml() -> str:
       - xfId=6: サブヘッダー（薄青背景・太字）
       - xfId=7: 日付ヘッダー（小さいフォント・中央揃え）
       - xfId=8: 説明テキスト（イタリック）
-      - xfId=9: パーセント表示（入力セル）
+      - xfId=9: パーセント入力セル
+      - xfId=10: 日付入力セル
     """
-    # フォント定義
-    fonts = (
-        '<fonts count="6">'
-        '<font><sz val="11"/><color theme="1"/><name val="Meiryo UI"/><family val="2"/></font>'  # 0: 標準
-        '<font><b/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Meiryo UI"/><family val="2"/></font>'  # 1: ヘッダー用（白太字）
-        '<font><b/><sz val="14"/><color theme="1"/><name val="Meiryo UI"/><family val="2"/></font>'  # 2: タイトル用
-        '<font><b/><sz val="11"/><color theme="1"/><name val="Meiryo UI"/><family val="2"/></font>'  # 3: サブヘッダー用（太字）
-        '<font><sz val="9"/><color theme="1"/><name val="Meiryo UI"/><family val="2"/></font>'  # 4: 小さいフォント
-        '<font><i/><sz val="10"/><color rgb="FF666666"/><name val="Meiryo UI"/><family val="2"/></font>'  # 5: 説明用（イタリック・グレー）
-        '</fonts>'
-    )
+    fonts, fills, borders, cell_xfs = _compact_style_tables(FONT_DEFS, FILL_DEFS, BORDER_DEFS, CELL_XF_DEFS)
 
-    # 塗りつぶし定義
-    fills = (
-        '<fills count="6">'
-        '<fill><patternFill patternType="none"/></fill>'  # 0: なし
-        '<fill><patternFill patternType="gray125"/></fill>'  # 1: グレーパターン
-        '<fill><patternFill patternType="solid"><fgColor rgb="FF2C3E50"/><bgColor indexed="64"/></patternFill></fill>'  # 2: ダークブルー（ヘッダー）
-        '<fill><patternFill patternType="solid"><fgColor rgb="FFEAF2F8"/><bgColor indexed="64"/></patternFill></fill>'  # 3: 薄青（入力セル）
-        '<fill><patternFill patternType="solid"><fgColor rgb="FFF5F5F5"/><bgColor indexed="64"/></patternFill></fill>'  # 4: 薄グレー（計算セル）
-        '<fill><patternFill patternType="solid"><fgColor rgb="FFD5E8F7"/><bgColor indexed="64"/></patternFill></fill>'  # 5: 薄青（サブヘッダー）
-        '</fills>'
-    )
-
-    # 罫線定義
-    borders = (
-        '<borders count="4">'
-        '<border><left/><right/><top/><bottom/><diagonal/></border>'  # 0: なし
-        '<border>'  # 1: 薄い罫線（全方向）
-        '<left style="thin"><color indexed="64"/></left>'
-        '<right style="thin"><color indexed="64"/></right>'
-        '<top style="thin"><color indexed="64"/></top>'
-        '<bottom style="thin"><color indexed="64"/></bottom>'
-        '<diagonal/>'
-        '</border>'
-        '<border>'  # 2: 下線のみ
-        '<left/><right/><top/>'
-        '<bottom style="thin"><color indexed="64"/></bottom>'
-        '<diagonal/>'
-        '</border>'
-        '<border>'  # 3: 太い下線
-        '<left/><right/><top/>'
-        '<bottom style="medium"><color rgb="FF2C3E50"/></bottom>'
-        '<diagonal/>'
-        '</border>'
-        '</borders>'
-    )
-
-    # 数値フォーマット
-    num_fmts = (
-        '<numFmts count="2">'
-        '<numFmt numFmtId="164" formatCode="yyyy/mm/dd"/>'  # 日付
-        '<numFmt numFmtId="165" formatCode="0%"/>'  # パーセント
-        '</numFmts>'
-    )
-
-    # セルフォーマット定義
-    cell_xfs = (
-        '<cellXfs count="11">'
-        # 0: 標準（ロック）
-        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
-        # 1: ロック解除（編集可能）
-        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyProtection="1"><protection locked="0"/></xf>'
-        # 2: ヘッダー（青背景・白太字・罫線・中央揃え）
-        '<xf numFmtId="0" fontId="1" fillId="2" borderId="1" xfId="0" applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1"><alignment horizontal="center" vertical="center"/></xf>'
-        # 3: 入力セル（薄青背景・罫線・ロック解除）
-        '<xf numFmtId="0" fontId="0" fillId="3" borderId="1" xfId="0" applyFill="1" applyBorder="1" applyProtection="1"><protection locked="0"/></xf>'
-        # 4: タイトル（大きい太字）
-        '<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
-        # 5: 計算セル（グレー背景・罫線）
-        '<xf numFmtId="0" fontId="0" fillId="4" borderId="1" xfId="0" applyFill="1" applyBorder="1"/>'
-        # 6: サブヘッダー（薄青背景・太字・罫線）
-        '<xf numFmtId="0" fontId="3" fillId="5" borderId="1" xfId="0" applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1"><alignment horizontal="center" vertical="center"/></xf>'
-        # 7: 日付ヘッダー（小フォント・中央揃え・下線）
-        '<xf numFmtId="164" fontId="4" fillId="0" borderId="2" xfId="0" applyNumberFormat="1" applyFont="1" applyBorder="1" applyAlignment="1"><alignment horizontal="center"/></xf>'
-        # 8: 説明テキスト（イタリック）
-        '<xf numFmtId="0" fontId="5" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
-        # 9: パーセント入力セル
-        '<xf numFmtId="165" fontId="0" fillId="3" borderId="1" xfId="0" applyNumberFormat="1" applyFill="1" applyBorder="1" applyProtection="1"><protection locked="0"/></xf>'
-        # 10: 日付入力セル（薄青背景・日付フォーマット・罫線・ロック解除）
-        '<xf numFmtId="164" fontId="0" fillId="3" borderId="1" xfId="0" applyNumberFormat="1" applyFill="1" applyBorder="1" applyProtection="1"><protection locked="0"/></xf>'
-        '</cellXfs>'
-    )
-
-    # 条件付き書式用スタイル（dxf）
-    dxfs = (
-        '<dxfs count="11">'
-        '<dxf><border><right style="medium"><color rgb="FFE74C3C"/></right></border></dxf>'  # 0: 今日ライン
-        '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FF95A5A6"/><bgColor indexed="64"/></patternFill></fill></dxf>'  # 1: 完了（グレー）
-        '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FFE74C3C"/><bgColor indexed="64"/></patternFill></fill></dxf>'  # 2: 遅延（赤）
-        '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FF3498DB"/><bgColor indexed="64"/></patternFill></fill></dxf>'  # 3: 進行中（青）
-        '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FFECF0F1"/><bgColor indexed="64"/></patternFill></fill></dxf>'  # 4: 未着手（薄グレー）
-        '<dxf><font><color rgb="FFFFFFFF"/></font><fill><patternFill patternType="solid"><fgColor rgb="FF3498DB"/><bgColor indexed="64"/></patternFill></fill></dxf>'  # 5: 進行中ステータス
-        '<dxf><font><color rgb="FFFFFFFF"/></font><fill><patternFill patternType="solid"><fgColor rgb="FFE74C3C"/><bgColor indexed="64"/></patternFill></fill></dxf>'  # 6: 遅延ステータス
-        '<dxf><font><color rgb="FFFFFFFF"/></font><fill><patternFill patternType="solid"><fgColor rgb="FF27AE60"/><bgColor indexed="64"/></patternFill></fill></dxf>'  # 7: 完了ステータス
-        '<dxf><font><b/><color rgb="FFFFFFFF"/></font><fill><patternFill patternType="solid"><fgColor rgb="FF34495E"/><bgColor indexed="64"/></patternFill></fill></dxf>'  # 8: Lv1行（濃紺背景・白太字）
-        '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FFF39C12"/><bgColor indexed="64"/></patternFill></fill></dxf>'  # 9: 警告（オレンジ）- 未リンク
-        '<dxf><fill><patternFill patternType="solid"><fgColor rgb="FFF1C40F"/><bgColor indexed="64"/></patternFill></fill></dxf>'  # 10: 警告（黄）- 範囲外
-        '</dxfs>'
-    )
+    def section(tag: str, items: Sequence[str]) -> str:
+        return f'<{tag} count="{len(items)}">{"".join(items)}</{tag}>'
 
     return (
         XML_DECL +
         '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
-        f'{num_fmts}'
-        f'{fonts}'
-        f'{fills}'
-        f'{borders}'
-        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
-        f'{cell_xfs}'
-        '<cellStyles count="1"><cellStyle name="標準" xfId="0" builtinId="0"/></cellStyles>'
-        f'{dxfs}'
-        '<tableStyles count="0" defaultTableStyle="TableStyleMedium9" defaultPivotStyle="PivotStyleLight16"/>'
+        + section("numFmts", [f'<numFmt numFmtId="{fmt_id}" formatCode="{_xml_attr_escape(code)}"/>' for fmt_id, code in NUM_FMT_DEFS])
+        + section("fonts", [font.to_xml() for font in fonts])
+        + section("fills", [fill.to_xml() for fill in fills])
+        + section("borders", borders)
+        + '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        + section("cellXfs", [xf.to_xml() for xf in cell_xfs])
+        + '<cellStyles count="1"><cellStyle name="標準" xfId="0" builtinId="0"/></cellStyles>'
+        + section("dxfs", DXF_DEFS)
+        + '<tableStyles count="0" defaultTableStyle="TableStyleMedium9" defaultPivotStyle="PivotStyleLight16"/>'
         '</styleSheet>'
     )
 
 
+# スタイルシートは引数を持たず不変なので、インポート時に一度だけ生成・エンコードする
+STYLES_XML: bytes = _build_styles_xml().encode("utf-8")
+
+
+def styles_xml() -> bytes:
+    """事前生成済みのスタイルシート（UTF-8 の bytes）を返す。"""
+    return STYLES_XML
+
+
 # スタイル ID 定数（styles_xml の cellXfs と対応）
 STYLE_LOCKED = 0
 STYLE_UNLOCKED = 1
@@ -670,21 +1150,30 @@ STYLE_PERCENT_INPUT = 9
 STYLE_DATE_INPUT = 10
 
 
+def _read_vba_source(path: Path) -> str:
+    """VBA ソースをバイト列で読み込み、改行を LF に正規化してから UTF-8 としてデコードする。"""
+    data = path.read_bytes().replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data.decode("utf-8")
+
+
+@lru_cache(maxsize=1)
 def load_vba_modules() -> Mapping[str, str]:
+    """docs/vba 以下の .bas / .cls を読み込む（結果はプロセス内でキャッシュする）。"""
     modules: dict[str, str] = {}
     if not VBA_SOURCE_DIR.exists():
-        return modules
+        return MappingProxyType(modules)
 
     for path in sorted(VBA_SOURCE_DIR.glob("*.bas")):
-        modules[path.stem] = path.read_text(encoding="utf-8")
+        modules[path.stem] = _read_vba_source(path)
 
     for path in sorted(VBA_SOURCE_DIR.glob("*.cls")):
-        modules[path.stem] = path.read_text(encoding="utf-8")
+        modules[path.stem] = _read_vba_source(path)
 
-    return modules
+    # キャッシュした辞書を呼び出し側で書き換えられないよう読み取り専用ビューで返す
+    return MappingProxyType(modules)
 
 
-def vba_project_binary(modules: Mapping[str, str], regenerate: bool = False) -> bytes | None:
+def vba_project_binary(modules: Mapping[str, str] | None = None, regenerate: bool = False) -> bytes | None:
     """VBAプロジェクトバイナリを取得または生成する。
 
     vbaProject.binはOLE複合ドキュメント形式である必要がある。
@@ -694,7 +1183,7 @@ def vba_project_binary(modules: Mapping[str, str], regenerate: bool = False) ->
     3. 自動生成に失敗した場合はNoneを返す
 
     Args:
-        modules: VBAモジュールの辞書 {モジュール名: コード}
+        modules: VBAモジュールの辞書 {モジュール名: コード}（None の場合は生成時に load_vba_modules で読み込む）
         regenerate: 既存のキャッシュを無視して再生成するか
 
     Returns:
@@ -704,30 +1193,30 @@ def vba_project_binary(modules: Mapping[str, str], regenerate: bool = False) ->
     template_path = VBA_SOURCE_DIR / "vbaProject.bin"
 
     if not regenerate and template_path.exists():
-        print(f"📦 vbaProject.bin を読み込み: {template_path}")
+        logger.info("📦 vbaProject.bin を読み込み: %s", template_path)
         return template_path.read_bytes()
 
     # 自動生成を試みる
     if regenerate:
-        print("🔄 vbaProject.bin を再生成中...")
+        logger.info("🔄 vbaProject.bin を再生成中...")
     else:
-        print("🔧 vbaProject.bin を自動生成中...")
+        logger.info("🔧 vbaProject.bin を自動生成中...")
 
     try:
         from create_vba_binary import generate_vba_project_bin
+        if modules is None:
+            modules = load_vba_modules()
         vba_binary = generate_vba_project_bin(dict(modules))
         # 生成したバイナリをキャッシュとして保存
         template_path.write_bytes(vba_binary)
-        print(f"✅ vbaProject.bin を生成しました ({len(vba_binary)} bytes)")
+        logger.info("✅ vbaProject.bin を生成しました (%d bytes)", len(vba_binary))
         return vba_binary
     except ImportError:
         # create_vba_binary モジュールが見つからない場合
-        print("⚠️  警告: create_vba_binary モジュールが見つかりません")
-        print("   VBA機能は手動で追加する必要があります")
+        logger.warning("⚠️  警告: create_vba_binary モジュールが見つかりません\n   VBA機能は手動で追加する必要があります")
         return None
     except Exception as e:
-        print(f"⚠️  警告: vbaProject.bin の生成に失敗しました: {e}")
-        print("   VBA機能は手動で追加する必要があります")
+        logger.warning("⚠️  警告: vbaProject.bin の生成に失敗しました: %s\n   VBA機能は手動で追加する必要があります", e)
         return None
 
 
@@ -823,10 +1312,13 @@ VBA_MODULE_PLAN: List[VBAModulePlan] = [
 
 # --------------------------- シート定義 ---------------------------
 
-def config_sheet(password_hash: str = "") -> str:
+@lru_cache(maxsize=32)
+def config_sheet(password_hash: str = "") -> bytes:
     """Config シートを生成する。
 
     編集可能: 祝日 B4:B200、担当者 D4:D200、ステータス F4:F200
+
+    入力は不変のタプルのみなので、生成した XML は引数ごとにキャッシュして再利用する。
     """
     cells: List[Tuple[int, int, object]] = []
     styles: dict[Tuple[int, int], int] = {}
@@ -893,6 +1385,24 @@ class StyledCell:
     style_id: int = STYLE_LOCKED
 
 
+# タスク行の計算列の数式テンプレート（%(row)d に行番号を埋め込む）
+_END_DATE_FORMULA_TMPL = 'IF(OR(D%(row)d="",E%(row)d="")," ",WORKDAY(D%(row)d,E%(row)d-1,Config!$B$4:$B$20))'
+_STATUS_FORMULA_TMPL = (
+    'IFS(G%(row)d=1,"完了",AND(F%(row)d<TODAY(),G%(row)d<1),"遅延",'
+    'AND(D%(row)d<=TODAY(),G%(row)d<1),"進行中",TRUE,"未着手")'
+)
+# タスク行の入力セル（列番号, スタイルID）: Lv, タスク名, 担当, 開始日, 工数, 進捗率, 備考
+_TASK_INPUT_STYLES: Tuple[Tuple[int, int], ...] = (
+    (1, STYLE_INPUT),
+    (2, STYLE_INPUT),
+    (3, STYLE_INPUT),
+    (4, STYLE_DATE_INPUT),
+    (5, STYLE_INPUT),
+    (7, STYLE_PERCENT_INPUT),
+    (9, STYLE_INPUT),
+)
+
+
 def template_cells(sample: bool = False) -> Tuple[List[Tuple[int, int, object]], dict[Tuple[int, int], int]]:
     """WBS シートのセルデータとスタイルマッピングを返す。"""
     cells: List[Tuple[int, int, object]] = []
@@ -938,31 +1448,37 @@ def template_cells(sample: bool = False) -> Tuple[List[Tuple[int, int, object]],
     cells.append((3, gantt_start_col, Formula('IF($K$2="","",SEQUENCE(1,60,$K$2,1))')))
     styles[(3, gantt_start_col)] = STYLE_DATE_HEADER
     # 残りの列にもスタイルを適用（スピル先）
-    for offset in range(1, gantt_columns):
-        styles[(3, gantt_start_col + offset)] = STYLE_DATE_HEADER
+    styles.update(dict.fromkeys(
+        ((3, gantt_start_col + offset) for offset in range(1, gantt_columns)),
+        STYLE_DATE_HEADER,
+    ))
 
     # タスク行のテンプレート（数式のみ）- 十分な行数を確保
     task_rows = 20 if sample else 14
-    for row in range(5, 5 + task_rows):
-        # 終了日（計算列）
-        cells.append((row, 6, Formula(f'IF(OR(D{row}="",E{row}="")," ",WORKDAY(D{row},E{row}-1,Config!$B$4:$B$20))')))
-        styles[(row, 6)] = STYLE_CALC
-        # ステータス（計算列）
-        cells.append((row, 8, Formula(f'IFS(G{row}=1,"完了",AND(F{row}<TODAY(),G{row}<1),"遅延",AND(D{row}<=TODAY(),G{row}<1),"進行中",TRUE,"未着手")')))
-        styles[(row, 8)] = STYLE_CALC
-
-        # 入力セルのスタイルを設定（空の値でもセルを作成してスタイルを適用）
-        for col in [1, 2, 3, 5, 9]:  # Lv, タスク名, 担当, 工数, 備考
-            styles[(row, col)] = STYLE_INPUT
-            # サンプルデータがない行には空文字を入れてスタイルを適用
-            if not sample or row >= 5 + len(SAMPLE_TASKS):
-                cells.append((row, col, ""))
-        styles[(row, 4)] = STYLE_DATE_INPUT  # 開始日
-        if not sample or row >= 5 + len(SAMPLE_TASKS):
-            cells.append((row, 4, ""))  # 空の開始日セル
-        styles[(row, 7)] = STYLE_PERCENT_INPUT  # 進捗率
-        if not sample or row >= 5 + len(SAMPLE_TASKS):
-            cells.append((row, 7, ""))  # 空の進捗率セル
+    task_row_range = range(5, 5 + task_rows)
+    # 終了日・ステータス（計算列）
+    cells.extend(chain.from_iterable(
+        (
+            (row, 6, Formula(_END_DATE_FORMULA_TMPL % {"row": row})),
+            (row, 8, Formula(_STATUS_FORMULA_TMPL % {"row": row})),
+        )
+        for row in task_row_range
+    ))
+    styles.update(dict.fromkeys(((row, col) for row in task_row_range for col in (6, 8)), STYLE_CALC))
+
+    # 入力セルのスタイルを設定（空の値でもセルを作成してスタイルを適用）
+    styles.update({
+        (row, col): style_id
+        for row in task_row_range
+        for col, style_id in _TASK_INPUT_STYLES
+    })
+    # サンプルデータがない行には空文字を入れてスタイルを適用
+    blank_start = 5 + len(SAMPLE_TASKS) if sample else 5
+    cells.extend(
+        (row, col, "")
+        for row in range(blank_start, 5 + task_rows)
+        for col, _ in _TASK_INPUT_STYLES
+    )
 
     # サンプルデータ
     if sample:
@@ -987,7 +1503,7 @@ def template_cells(sample: bool = False) -> Tuple[List[Tuple[int, int, object]],
     return cells, styles
 
 
-def template_data_validations() -> str:
+def _build_template_data_validations() -> str:
     """WBSシート用のデータバリデーションを生成する。
 
     バリデーション内容:
@@ -1031,6 +1547,14 @@ def template_data_validations() -> str:
     )
 
 
+TEMPLATE_DATA_VALIDATIONS: bytes = _build_template_data_validations().encode("utf-8")
+
+
+def template_data_validations() -> bytes:
+    """事前生成済みの WBS シート用データバリデーション（UTF-8 の bytes）を返す。"""
+    return TEMPLATE_DATA_VALIDATIONS
+
+
 def get_template_buttons() -> List[ButtonDefinition]:
     """Template / PRJ シート用のボタン定義を返す。"""
     return [
@@ -1130,18 +1654,22 @@ def get_kanban_column_defs() -> List[ColumnDef]:
     ]
 
 
+@lru_cache(maxsize=32)
 def template_sheet(
     sample: bool = False,
     password_hash: str = "",
     include_buttons: bool = True,
     vml_rid: str | None = None,
-) -> str:
+) -> bytes:
     """Template / PRJ シートを生成する。
 
     編集可能: Lv(A), タスク名(B), 担当(C), 開始日(D), 工数(E), 進捗率(G), 備考(I)
              タスク行 5〜104 行目。行挿入許可。
     保護: 終了日(F), ステータス(H), 全体進捗(J2), ヘッダー(4行目), ガント領域
 
+    PRJ シートは引数が同じならバイト単位で同一になるため、生成結果は引数ごとにキャッシュし、
+    サンプルなしの PRJ を何枚作っても XML の組み立ては 1 回で済ませる。
+
     Args:
         sample: サンプルデータを含めるか
         password_hash: シート保護用パスワードハッシュ
@@ -1166,7 +1694,7 @@ def template_sheet(
     )
 
 
-def template_conditional_formattings() -> List[str]:
+def _build_template_conditional_formattings() -> List[str]:
     """条件付き書式の XML を生成する。
 
     注意: 数式内の < > はXMLエスケープが必要（&lt; &gt;）
@@ -1209,7 +1737,56 @@ def template_conditional_formattings() -> List[str]:
     return [gantt_rules, status_rules, lv1_rules]
 
 
-def case_master_sheet(password_hash: str = "", m365_mode: bool = False) -> str:
+TEMPLATE_CONDITIONAL_FORMATTINGS: Tuple[bytes, ...] = tuple(
+    rule.encode("utf-8") for rule in _build_template_conditional_formattings()
+)
+
+
+def template_conditional_formattings() -> Tuple[bytes, ...]:
+    """事前生成済みの WBS シート用条件付き書式（UTF-8 の bytes）を返す。"""
+    return TEMPLATE_CONDITIONAL_FORMATTINGS
+
+
+# Case_Master / Measure_Master 用の固定 XML 断片（インポート時に一度だけエンコードする）
+CASE_MASTER_DATA_VALIDATIONS: bytes = (
+    '<dataValidations count="1">'
+    '<dataValidation type="list" allowBlank="1" showDropDown="1" showErrorMessage="1" showInputMessage="1" errorStyle="stop" errorTitle="入力エラー" error="リストから選択してください" promptTitle="案件IDの選択" prompt="プルダウンから案件IDを選択してください" sqref="H1">'
+    "<formula1>CaseIds</formula1>"
+    "</dataValidation>"
+    "</dataValidations>"
+).encode("utf-8")
+
+MEASURE_MASTER_DATA_VALIDATIONS: bytes = (
+    '<dataValidations count="1">'
+    '<dataValidation type="list" allowBlank="0" showDropDown="1" showErrorMessage="1" showInputMessage="1" errorStyle="stop" errorTitle="入力エラー" error="リスト外の値は入力できません" promptTitle="案件IDの選択" prompt="プルダウンから案件IDを選択してください" sqref="B2:B104">'
+    "<formula1>CaseIds</formula1>"
+    "</dataValidation>"
+    "</dataValidations>"
+).encode("utf-8")
+
+# 警告用条件付き書式
+MEASURE_MASTER_CONDITIONAL_FORMATTINGS: Tuple[bytes, ...] = (
+    # G列: 「未リンク」時にオレンジ背景（dxfId 9）
+    (
+        '<conditionalFormatting sqref="G2:G104">'
+        '<cfRule type="containsText" dxfId="9" priority="1" operator="containsText" text="未リンク">'
+        '<formula>NOT(ISERROR(SEARCH("未リンク",G2)))</formula>'
+        '</cfRule>'
+        '</conditionalFormatting>'
+    ).encode("utf-8"),
+    # B列: 無効な案件ID時に黄色背景（dxfId 10）- 空でなく、Case_Masterに存在しない場合
+    (
+        '<conditionalFormatting sqref="B2:B104">'
+        '<cfRule type="expression" dxfId="10" priority="2">'
+        '<formula>AND(B2&lt;&gt;"",ISNA(MATCH(B2,CaseIds,0)))</formula>'
+        '</cfRule>'
+        '</conditionalFormatting>'
+    ).encode("utf-8"),
+)
+
+
+@lru_cache(maxsize=32)
+def case_master_sheet(password_hash: str = "", m365_mode: bool = False) -> bytes:
     """Case_Master シートを生成する。
 
     編集可能: 案件ID(A), 案件名(B), メモ(C) の 2〜100 行目、案件選択(H1)
@@ -1291,18 +1868,10 @@ def case_master_sheet(password_hash: str = "", m365_mode: bool = False) -> str:
         cells.append((4, 7, "💡 H1で案件IDを選択すると施策数を表示"))
         styles[(4, 7)] = STYLE_DESCRIPTION
 
-    data_validations = (
-        '<dataValidations count="1">'
-        '<dataValidation type="list" allowBlank="1" showDropDown="1" showErrorMessage="1" showInputMessage="1" errorStyle="stop" errorTitle="入力エラー" error="リストから選択してください" promptTitle="案件IDの選択" prompt="プルダウンから案件IDを選択してください" sqref="H1">'
-        "<formula1>CaseIds</formula1>"
-        "</dataValidation>"
-        "</dataValidations>"
-    )
-
     protection = SheetProtection(password_hash=password_hash, allow_insert_rows=False)
     return worksheet_xml(
         cells,
-        data_validations=data_validations,
+        data_validations=CASE_MASTER_DATA_VALIDATIONS,
         sheet_protection=protection,
         column_defs=get_case_master_column_defs(),
         freeze_row=1,
@@ -1310,7 +1879,8 @@ def case_master_sheet(password_hash: str = "", m365_mode: bool = False) -> str:
     )
 
 
-def measure_master_sheet(password_hash: str = "") -> str:
+@lru_cache(maxsize=32)
+def measure_master_sheet(password_hash: str = "") -> bytes:
     """Measure_Master シートを生成する。
 
     編集可能: 施策ID(A), 親案件ID(B), 施策名(C), 開始日(D), WBSシート名(F), 備考(H) の 2〜104 行目
@@ -1348,37 +1918,11 @@ def measure_master_sheet(password_hash: str = "") -> str:
         for col in [1, 2, 3, 4, 6, 8]:
             styles[(row, col)] = STYLE_INPUT
 
-    data_validations = (
-        '<dataValidations count="1">'
-        '<dataValidation type="list" allowBlank="0" showDropDown="1" showErrorMessage="1" showInputMessage="1" errorStyle="stop" errorTitle="入力エラー" error="リスト外の値は入力できません" promptTitle="案件IDの選択" prompt="プルダウンから案件IDを選択してください" sqref="B2:B104">'
-        "<formula1>CaseIds</formula1>"
-        "</dataValidation>"
-        "</dataValidations>"
-    )
-
-    # 警告用条件付き書式
-    # G列: 「未リンク」時にオレンジ背景（dxfId 9）
-    unlinked_warning = (
-        '<conditionalFormatting sqref="G2:G104">'
-        '<cfRule type="containsText" dxfId="9" priority="1" operator="containsText" text="未リンク">'
-        '<formula>NOT(ISERROR(SEARCH("未リンク",G2)))</formula>'
-        '</cfRule>'
-        '</conditionalFormatting>'
-    )
-    # B列: 無効な案件ID時に黄色背景（dxfId 10）- 空でなく、Case_Masterに存在しない場合
-    invalid_case_warning = (
-        '<conditionalFormatting sqref="B2:B104">'
-        '<cfRule type="expression" dxfId="10" priority="2">'
-        '<formula>AND(B2&lt;&gt;"",ISNA(MATCH(B2,CaseIds,0)))</formula>'
-        '</cfRule>'
-        '</conditionalFormatting>'
-    )
-
     protection = SheetProtection(password_hash=password_hash, allow_insert_rows=False)
     return worksheet_xml(
         cells,
-        data_validations=data_validations,
-        conditional_formattings=[unlinked_warning, invalid_case_warning],
+        data_validations=MEASURE_MASTER_DATA_VALIDATIONS,
+        conditional_formattings=MEASURE_MASTER_CONDITIONAL_FORMATTINGS,
         sheet_protection=protection,
         column_defs=get_measure_master_column_defs(),
         freeze_row=1,
@@ -1386,7 +1930,7 @@ def measure_master_sheet(password_hash: str = "") -> str:
     )
 
 
-def kanban_sheet(password_hash: str = "", m365_mode: bool = False) -> str:
+def kanban_sheet(password_hash: str = "", m365_mode: bool = False) -> bytes:
     """Kanban_View シートを生成する。
 
     編集可能: B2 (WBS シート名選択) のみ
@@ -1560,72 +2104,95 @@ def kanban_sheet(password_hash: str = "", m365_mode: bool = False) -> str:
 
 # --------------------------- レポート生成 ---------------------------
 
+# レポートの区切り線・固定ブロック
+_REPORT_SEP = "=" * 50
+_REPORT_SUBSEP = "-" * 50
+_REPORT_HEADER_LINES: Tuple[str, ...] = (_REPORT_SEP, "Modern Excel PMS 生成レポート", _REPORT_SEP, "", "## 基本情報")
+_REPORT_PROGRESS_HEADER_LINES: Tuple[str, ...] = ("", _REPORT_SUBSEP, "## 進捗サマリー (サンプルデータ)", _REPORT_SUBSEP)
+
+
+def _build_master_data_lines() -> Tuple[str, ...]:
+    """マスターデータ節（不変のデータセットのみに依存）の行を生成する。"""
+    lines = ["", _REPORT_SUBSEP, "## マスターデータ", _REPORT_SUBSEP, "", "案件一覧:"]
+    # 案件に紐づく施策数を計算
+    lines.extend(
+        f"  - {case_id}: {name} (施策数: {sum(1 for m in MEASURES if m[1] == case_id)})"
+        for case_id, name in CASES
+    )
+    lines.extend(("", "施策一覧:"))
+    lines.extend(chain.from_iterable(
+        (f"  - {mid} ({cid}) {name}", f"      開始日: {start} / WBS: {sheet_name}")
+        for mid, cid, name, start, sheet_name in MEASURES
+    ))
+    lines.extend(("", "ステータス候補:"))
+    lines.extend(f"  - {status}" for status in STATUSES)
+    lines.extend(("", "担当者マスタ:"))
+    lines.extend(f"  - {member}" for member in MEMBERS)
+    lines.extend(("", _REPORT_SEP))
+    return tuple(lines)
+
+
+_REPORT_MASTER_DATA_LINES = _build_master_data_lines()
+
+
+def _status_bar_line(status: str, count: int, total_tasks: int) -> str:
+    """ステータス別件数の 1 行（5% ごとに # 1個の棒グラフ付き）を返す。"""
+    pct = count / total_tasks * 100 if total_tasks > 0 else 0
+    return f"  {status:6s}: {count:2d} ({pct:5.1f}%) {'#' * int(pct / 5)}"
+
+
 def generate_report_lines(
     project_count: int,
     sample_first_project: bool,
     sample_all_projects: bool,
     workbook_path: Path,
-) -> List[str]:
-    """ブック構成と進捗状況を日本語でまとめたレポートを返す。"""
+) -> Iterator[str]:
+    """ブック構成と進捗状況を日本語でまとめたレポートを 1 行ずつ返す（ジェネレーター）。"""
 
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M")
     has_sample = sample_first_project or sample_all_projects
 
-    lines = [
-        "=" * 50,
-        "Modern Excel PMS 生成レポート",
-        "=" * 50,
-        "",
-        "## 基本情報",
-        f"生成日時: {generated_at}",
-        f"ブック出力先: {workbook_path}",
-        f"PRJ シート数: {project_count}",
-        f"サンプルデータ: {'全てのPRJに配置' if sample_all_projects else ('最初の1枚に配置' if sample_first_project else 'なし')}",
-    ]
+    yield from _REPORT_HEADER_LINES
+    yield f"生成日時: {generated_at}"
+    yield f"ブック出力先: {workbook_path}"
+    yield f"PRJ シート数: {project_count}"
+    yield f"サンプルデータ: {'全てのPRJに配置' if sample_all_projects else ('最初の1枚に配置' if sample_first_project else 'なし')}"
 
     # サンプルデータがある場合は進捗分析を追加
     if has_sample:
-        lines.append("")
-        lines.append("-" * 50)
-        lines.append("## 進捗サマリー (サンプルデータ)")
-        lines.append("-" * 50)
+        yield from _REPORT_PROGRESS_HEADER_LINES
 
-        # 全体進捗率（工数加重平均）
-        overall_progress = calculate_weighted_progress(SAMPLE_TASKS)
-        total_effort = sum(t.effort for t in SAMPLE_TASKS)
-        completed_effort = sum(t.effort * t.progress for t in SAMPLE_TASKS)
+        # 総工数・消化工数・ステータス別件数をタスク1回の走査でまとめて集計
+        total_effort, completed_effort, status_counts = summarize(SAMPLE_TASKS)
 
-        lines.append("")
-        lines.append(f"全体進捗率: {overall_progress:.1%}")
-        lines.append(f"  - 総工数: {total_effort} 人日")
-        lines.append(f"  - 消化工数: {completed_effort:.1f} 人日")
+        # 全体進捗率（工数加重平均）
+        overall_progress = weighted_progress(total_effort, completed_effort)
 
         # ステータス別集計
-        status_counts = count_by_status(SAMPLE_TASKS)
         total_tasks = len(SAMPLE_TASKS)
         completed_tasks = status_counts.get("完了", 0)
 
-        lines.append("")
-        lines.append("ステータス別タスク数:")
+        yield ""
+        yield f"全体進捗率: {overall_progress:.1%}"
+        yield f"  - 総工数: {total_effort} 人日"
+        yield f"  - 消化工数: {completed_effort:.1f} 人日"
+        yield ""
+        yield "ステータス別タスク数:"
         for status in STATUSES:
-            count = status_counts.get(status, 0)
-            pct = count / total_tasks * 100 if total_tasks > 0 else 0
-            bar = "#" * int(pct / 5)  # 5% ごとに # 1個
-            lines.append(f"  {status:6s}: {count:2d} ({pct:5.1f}%) {bar}")
+            yield _status_bar_line(status, status_counts.get(status, 0), total_tasks)
 
         # 案件消化度
-        lines.append("")
-        lines.append(f"タスク完了率: {completed_tasks}/{total_tasks} ({completed_tasks/total_tasks:.1%})")
+        yield ""
+        yield f"タスク完了率: {completed_tasks}/{total_tasks} ({completed_tasks/total_tasks:.1%})"
 
         # 施策別進捗（PRJ_001 のみサンプルがある想定）
-        lines.append("")
-        lines.append("施策別進捗:")
+        yield ""
+        yield "施策別進捗:"
         for mid, cid, name, start, sheet_name in MEASURES:
             if sheet_name == "PRJ_001":
-                prj_progress = overall_progress
-                lines.append(f"  - {mid} ({name}): {prj_progress:.1%}")
+                yield f"  - {mid} ({name}): {overall_progress:.1%}"
             else:
-                lines.append(f"  - {mid} ({name}): -- (データなし)")
+                yield f"  - {mid} ({name}): -- (データなし)"
 
         # 担当者別負荷
         owner_effort: dict[str, int] = {}
@@ -1634,62 +2201,37 @@ def generate_report_lines(
             owner_effort[task.owner] = owner_effort.get(task.owner, 0) + task.effort
             owner_completed[task.owner] = owner_completed.get(task.owner, 0) + task.effort * task.progress
 
-        lines.append("")
-        lines.append("担当者別負荷:")
+        yield ""
+        yield "担当者別負荷:"
         for owner in sorted(owner_effort.keys()):
             effort = owner_effort[owner]
-            completed = owner_completed[owner]
-            pct = completed / effort if effort > 0 else 0
-            lines.append(f"  - {owner}: {effort} 人日 (消化 {pct:.1%})")
-
-    lines.append("")
-    lines.append("-" * 50)
-    lines.append("## マスターデータ")
-    lines.append("-" * 50)
-
-    lines.append("")
-    lines.append("案件一覧:")
-    for case_id, name in CASES:
-        # 案件に紐づく施策数を計算
-        measure_count = sum(1 for m in MEASURES if m[1] == case_id)
-        lines.append(f"  - {case_id}: {name} (施策数: {measure_count})")
+            pct = owner_completed[owner] / effort if effort > 0 else 0
+            yield f"  - {owner}: {effort} 人日 (消化 {pct:.1%})"
 
-    lines.append("")
-    lines.append("施策一覧:")
-    for mid, cid, name, start, sheet_name in MEASURES:
-        lines.append(f"  - {mid} ({cid}) {name}")
-        lines.append(f"      開始日: {start} / WBS: {sheet_name}")
+    yield from _REPORT_MASTER_DATA_LINES
 
-    lines.append("")
-    lines.append("ステータス候補:")
-    for status in STATUSES:
-        lines.append(f"  - {status}")
 
-    lines.append("")
-    lines.append("担当者マスタ:")
-    for member in MEMBERS:
-        lines.append(f"  - {member}")
+def write_report_text(lines: Iterable[str], output_path: Path) -> None:
+    """レポートテキストを UTF-8 で書き出す（行を結合せず、バッファ付きで順次書き込む）。"""
 
-    lines.append("")
-    lines.append("=" * 50)
+    with output_path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(f"{line}\n" for line in lines)
 
-    return lines
 
-
-def write_report_text(lines: Sequence[str], output_path: Path) -> None:
-    """レポートテキストを UTF-8 で書き出す。"""
-
-    output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+# PDF 文字列リテラルでエスケープが必要な文字（\\, (, )）の変換テーブル
+_PDF_ESCAPE_TBL = str.maketrans({"\\": "\\\\", "(": "\\(", ")": "\\)"})
 
 
 def _escape_pdf_text(text: str) -> str:
-    """PDF 文字列リテラル向けのエスケープ処理。"""
+    """PDF 文字列リテラル向けのエスケープ処理（str.translate で 1 パス置換）。"""
 
-    sanitized = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
-    return sanitized
+    # 大半の行（ステータス名・担当者名・ID など）は対象文字を含まないのでそのまま返す
+    if "\\" not in text and "(" not in text and ")" not in text:
+        return text
+    return text.translate(_PDF_ESCAPE_TBL)
 
 
-def export_pdf_report(lines: Sequence[str], output_path: Path) -> None:
+def export_pdf_report(lines: Iterable[str], output_path: Path) -> None:
     """標準フォントのみで構成したシンプルな PDF を生成する。"""
 
     page_height = 842  # A4 高さ (pt)
@@ -1697,65 +2239,192 @@ def export_pdf_report(lines: Sequence[str], output_path: Path) -> None:
     margin_top = 50
     line_height = 16
 
-    content_lines: List[str] = ["BT", "/F1 12 Tf"]
-    y_cursor = page_height - margin_top
-    for line in lines:
-        escaped = _escape_pdf_text(line)
-        content_lines.append(f"1 0 0 1 {margin_left} {y_cursor} Tm ({escaped}) Tj")
-        y_cursor -= line_height
-        if y_cursor < margin_top:
-            break  # 1 ページのみサポート
-    content_lines.append("ET")
-    content_stream = "\n".join(content_lines).encode("utf-8")
-
-    objects: List[bytes] = []
-    objects.append(b"1 0 obj<< /Type /Catalog /Pages 2 0 R >>endobj\n")
-    objects.append(b"2 0 obj<< /Type /Pages /Count 1 /Kids [3 0 R] >>endobj\n")
-    objects.append(
+    # コンテンツストリームは bytearray に行ごとに 1 回の連結で追記する
+    content_stream = bytearray(b"BT\n/F1 12 Tf")
+    # 各行で共通のテキスト行列の前半（x 座標まで）は書式に埋め込んでおく
+    line_tmpl = b"\n1 0 0 1 %d %%d Tm (%%s) Tj" % margin_left
+    # 1 ページのみサポート: 行の y 座標を range で与え、ページに収まる行数だけ取り出して処理する
+    # （レポートが何行あっても、エスケープ・エンコードするのは先頭の 1 ページ分のみ）
+    y_positions = range(page_height - margin_top, margin_top - 1, -line_height)
+    for y_cursor, line in zip(y_positions, lines):
+        content_stream += line_tmpl % (y_cursor, _escape_pdf_text(line).encode("utf-8"))
+    content_stream += b"\nET"
+
+    # 各オブジェクトを 1 つのバッファに順に書き込み、同じパスで xref エントリーも組み立てる
+    out = bytearray(b"%PDF-1.4\n")
+    xref_entries = bytearray()
+    object_count = 1  # 0 番（free エントリー）を含む
+
+    def write_object(*chunks: bytes) -> None:
+        nonlocal object_count
+        xref_entries.extend(b"%010d 00000 n \n" % len(out))
+        object_count += 1
+        for chunk in chunks:
+            out.extend(chunk)
+
+    write_object(b"1 0 obj<< /Type /Catalog /Pages 2 0 R >>endobj\n")
+    write_object(b"2 0 obj<< /Type /Pages /Count 1 /Kids [3 0 R] >>endobj\n")
+    write_object(
         b"3 0 obj<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
         b"/Contents 4 0 R /Resources<< /Font << /F1 5 0 R >> >> >>endobj\n"
     )
-    objects.append(
-        f"4 0 obj<< /Length {len(content_stream)} >>stream\n".encode("utf-8")
-        + content_stream
-        + b"\nendstream\nendobj\n"
-    )
-    objects.append(b"5 0 obj<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>endobj\n")
-
-    # クロスリファレンスを組み立てる
-    offsets = []
-    position = len(b"%PDF-1.4\n")
-    for obj in objects:
-        offsets.append(position)
-        position += len(obj)
-
-    xref_entries = ["0000000000 65535 f "]
-    for offset in offsets:
-        xref_entries.append(f"{offset:010} 00000 n ")
-    xref_content = "\n".join(xref_entries) + "\n"
-
-    trailer = (
-        f"<< /Root 1 0 R /Size {len(objects) + 1} >>\nstartxref\n{position}\n%%EOF"
+    write_object(
+        b"4 0 obj<< /Length %d >>stream\n" % len(content_stream),
+        content_stream,
+        b"\nendstream\nendobj\n",
     )
+    write_object(b"5 0 obj<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>endobj\n")
 
-    pdf_binary = b"".join(
-        [
-            b"%PDF-1.4\n",
-            *objects,
-            b"xref\n0 ",
-            str(len(objects) + 1).encode("utf-8"),
-            b"\n",
-            xref_content.encode("utf-8"),
-            b"trailer\n",
-            trailer.encode("utf-8"),
-        ]
-    )
+    # クロスリファレンスとトレーラー
+    xref_position = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % object_count
+    out += xref_entries
+    out += b"trailer\n<< /Root 1 0 R /Size %d >>\nstartxref\n%d\n%%%%EOF" % (object_count, xref_position)
 
-    output_path.write_bytes(pdf_binary)
+    output_path.write_bytes(out)
 
 
 # --------------------------- メイン ---------------------------
 
+# このサイズを超えるパートは ZipFile.open('w') で分割書き込みする
+ZIP_STREAM_THRESHOLD = 64 * 1024
+ZIP_STREAM_CHUNK_SIZE = 64 * 1024
+# 出力ファイルのユーザー空間バッファサイズ
+ZIP_WRITE_BUFFER_SIZE = 1 << 20
+
+# 数百バイト程度のパートは圧縮しても縮まないため無圧縮で格納する
+ZIP_STORED_PARTS = ("[Content_Types].xml", "_rels/.rels", "xl/_rels/workbook.xml.rels")
+# 上記以外でもこのサイズ未満のパートは無圧縮で格納する
+ZIP_STORED_THRESHOLD = 512
+
+
+def _isal_level(compress_level: int | None) -> int:
+    """zlib の圧縮レベル (0〜9) を ISA-L のレベル (0〜3) に対応付ける。"""
+    if compress_level is None:
+        return isal_zlib.ISAL_DEFAULT_COMPRESSION
+    return min(3, (compress_level + 2) // 3)
+
+
+@contextmanager
+def deflate_backend() -> Iterator[None]:
+    """ISA-L が使える場合、この with ブロック内の ZIP_DEFLATED 圧縮を ISA-L に切り替える。
+
+    zipfile は内部関数 _get_compressor で圧縮オブジェクトを作るため、ブロックの間だけ差し替える。
+    生成される raw deflate ストリームは zlib と互換で、展開側には影響しない。
+    """
+    if not ISAL_AVAILABLE:
+        yield
+        return
+
+    original = zipfile._get_compressor
+
+    def get_compressor(compress_type: int, compresslevel: int | None = None):
+        if compress_type == zipfile.ZIP_DEFLATED:
+            return isal_zlib.compressobj(_isal_level(compresslevel), isal_zlib.DEFLATED, -15)
+        return original(compress_type, compresslevel)
+
+    zipfile._get_compressor = get_compressor
+    try:
+        yield
+    finally:
+        zipfile._get_compressor = original
+
+
+def write_zip_part(zf: zipfile.ZipFile, name: str, data: str | bytes) -> None:
+    """ZIP にパートを書き込む。
+
+    小さなリレーションシップ系パートと ZIP_STORED_THRESHOLD 未満のパートは ZIP_STORED、
+    大きなシート XML は ZipFile.open('w') でチャンクごとにストリーム書き込みする。
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if name in ZIP_STORED_PARTS or len(data) < ZIP_STORED_THRESHOLD:
+        zf.writestr(name, data, compress_type=zipfile.ZIP_STORED)
+        return
+    if len(data) <= ZIP_STREAM_THRESHOLD:
+        zf.writestr(name, data)
+        return
+    view = memoryview(data)
+    with zf.open(name, "w") as fh:
+        for offset in range(0, len(view), ZIP_STREAM_CHUNK_SIZE):
+            fh.write(view[offset:offset + ZIP_STREAM_CHUNK_SIZE])
+
+
+@dataclass(frozen=True)
+class DeflatedPart:
+    """圧縮済みパート（raw deflate ストリームと CRC・元サイズ）。"""
+
+    data: bytes
+    crc: int
+    file_size: int
+
+
+def deflate_part(data: bytes, compress_level: int | None = None) -> DeflatedPart:
+    """パートを一度だけ raw deflate で圧縮する（deflate_backend の切り替えも反映される）。"""
+    compressor = zipfile._get_compressor(zipfile.ZIP_DEFLATED, compress_level)
+    compressed = compressor.compress(data) + compressor.flush()
+    return DeflatedPart(compressed, zlib.crc32(data), len(data))
+
+
+# write_deflated_part が直接触る ZipFile の内部属性（CPython の実装に依存する）
+_ZIPFILE_RAW_WRITE_ATTRS = ("_lock", "_writing", "_writecheck", "_didModify", "_seekable", "start_dir", "fp", "filelist", "NameToInfo")
+
+
+def write_deflated_part(zf: zipfile.ZipFile, name: str, part: DeflatedPart) -> None:
+    """圧縮済みのパートを再圧縮せずに ZIP へ書き込む。
+
+    zipfile には圧縮済みデータを書き込む公開 API がないため、ZipFile._open_to_write と同じ手順で
+    ローカルヘッダーとデータを書き、セントラルディレクトリ用の ZipInfo を登録する。
+    使う内部属性が揃っていない zipfile 実装、シーク不可の出力、ZIP64 が必要なサイズでは
+    展開して write_zip_part で書き込むフォールバックにする。
+    """
+    if (
+        not all(hasattr(zf, attr) for attr in _ZIPFILE_RAW_WRITE_ATTRS)
+        or not zf._seekable
+        or part.file_size > zipfile.ZIP64_LIMIT
+        or len(part.data) > zipfile.ZIP64_LIMIT
+    ):
+        write_zip_part(zf, name, zlib.decompress(part.data, -15))
+        return
+
+    zinfo = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.external_attr = 0o600 << 16  # ?rw-------
+    zinfo.file_size = part.file_size
+    zinfo.compress_size = len(part.data)
+    zinfo.CRC = part.crc
+    with zf._lock:
+        if zf._writing:
+            raise ValueError("Can't write to the ZIP file while there is another write handle open on it.")
+        zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.fp.tell()
+        zf._writecheck(zinfo)
+        zf._didModify = True
+        zf.fp.write(zinfo.FileHeader(False))
+        zf.fp.write(part.data)
+        zf.start_dir = zf.fp.tell()
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[name] = zinfo
+
+
+def _sheet_builder_key(build_sheet: Callable[[], bytes]) -> Hashable:
+    """シートビルダー（functools.partial）を、同じシートを生成するもの同士で等しくなるキーに変換する。"""
+    if isinstance(build_sheet, partial):
+        return (build_sheet.func, build_sheet.args, tuple(sorted(build_sheet.keywords.items())))
+    return build_sheet
+
+
+def deflate_part_in_worker(data: bytes, compress_level: int | None = None) -> DeflatedPart:
+    """ワーカープロセスでパートを圧縮する（ISA-L の切り替えもワーカー側で行う）。"""
+    with deflate_backend():
+        return deflate_part(data, compress_level)
+
+
+def render_deflated_sheet(build_sheet: Callable[[], bytes], compress_level: int | None = None) -> DeflatedPart:
+    """シート XML を生成して圧縮する（ワーカープロセスで実行される）。"""
+    return deflate_part_in_worker(build_sheet(), compress_level)
+
+
 def build_workbook(
     project_count: int,
     sample_first_project: bool,
@@ -1765,8 +2434,11 @@ def build_workbook(
     include_buttons: bool = False,
     regenerate_vba: bool = False,
     m365_mode: bool = False,
+    compress_level: int | None = None,
+    workers: int = 1,
+    shared_strings: bool = False,
 ) -> List[str]:
-    """指定した枚数の PRJ シートを生成してブックを書き出し、レポート用テキストを返す。
+    """指定した枚数の PRJ シートを生成してブックを書き出し、レポート用テキストの行リストを返す。
 
     Args:
         project_count: 生成する PRJ シート数
@@ -1777,11 +2449,16 @@ def build_workbook(
         include_buttons: Up/Down ボタンを含めるか
         regenerate_vba: vbaProject.bin を強制的に再生成するか
         m365_mode: Microsoft 365 専用機能（FILTER/LET/MAP）を使用するか
+        compress_level: Deflate 圧縮レベル（0〜9、None で PMS_ZIP_LEVEL または既定の 1）。ISA-L 使用時は 0〜3 に換算する
+        workers: シート生成・圧縮に使うプロセス数（1 の場合は逐次処理）
+        shared_strings: 文字列セルをインライン文字列ではなく共有文字列テーブル (sharedStrings.xml) で出力するか
     """
 
-    # パスワードハッシュを計算
-    password = get_sheet_password()
-    pwd_hash = excel_password_hash(password)
+    if compress_level is None:
+        compress_level = get_zip_compress_level()
+
+    # パスワードハッシュはビルド開始時に一度だけ計算し、全シートのビルダーに渡す
+    pwd_hash = excel_password_hash(get_sheet_password())
 
     # ボタン定義を取得
     buttons = get_template_buttons() if include_buttons else []
@@ -1791,11 +2468,16 @@ def build_workbook(
     # key: sheet_index (1-based), value: (vml_filename, sheet_name)
     vml_sheets: dict[int, Tuple[str, str]] = {}
 
+    # シート XML は ZIP への書き込み直前に 1 枚ずつ生成する（全シート分の bytes を同時に保持しない）
     # Config / Template
+    # 空のテンプレートとサンプル入りのビルダーは 1 つずつ作り、Template と各 PRJ シートで同じものを共有する
+    template_kwargs = dict(password_hash=pwd_hash, include_buttons=include_buttons, vml_rid=vml_rid if include_buttons else None)
+    blank_template = partial(template_sheet, sample=False, **template_kwargs)
+    sample_template = partial(template_sheet, sample=True, **template_kwargs)
     sheet_names = ["Config", "Template"]
-    sheets_xml: List[str] = [
-        config_sheet(password_hash=pwd_hash),
-        template_sheet(sample=False, password_hash=pwd_hash, include_buttons=include_buttons, vml_rid=vml_rid if include_buttons else None),
+    sheet_builders: List[Callable[[], bytes]] = [
+        partial(config_sheet, password_hash=pwd_hash),
+        blank_template,
     ]
     # Template シート (sheet2) にボタンを追加
     if include_buttons:
@@ -1807,7 +2489,7 @@ def build_workbook(
         sheet_name = f"PRJ_{idx:03d}"
         sheet_names.append(sheet_name)
         is_sample = sample_all_projects or (sample_first_project and idx == 1)
-        sheets_xml.append(template_sheet(sample=is_sample, password_hash=pwd_hash, include_buttons=include_buttons, vml_rid=vml_rid if include_buttons else None))
+        sheet_builders.append(sample_template if is_sample else blank_template)
         # PRJ シートにもボタンを追加
         if include_buttons:
             sheet_index = 2 + idx  # Config=1, Template=2, PRJ_001=3, ...
@@ -1816,51 +2498,99 @@ def build_workbook(
 
     # 末尾のマスターシート群
     sheet_names.extend(["Case_Master", "Measure_Master", "Kanban_View"])
-    sheets_xml.extend([
-        case_master_sheet(password_hash=pwd_hash, m365_mode=m365_mode),
-        measure_master_sheet(password_hash=pwd_hash),
-        kanban_sheet(password_hash=pwd_hash, m365_mode=m365_mode),
+    sheet_builders.extend([
+        partial(case_master_sheet, password_hash=pwd_hash, m365_mode=m365_mode),
+        partial(measure_master_sheet, password_hash=pwd_hash),
+        partial(kanban_sheet, password_hash=pwd_hash, m365_mode=m365_mode),
     ])
 
-    defined_names = {
-        "CaseIds": "Case_Master!$A$2:$A$100",
-        "MeasureList": "Measure_Master!$A$2:$H$104",
-        "CaseDrilldownArea": "Case_Master!$G$3:$N$104",
-    }
-
     has_vml = len(vml_sheets) > 0
 
     # VBAバイナリを事前に取得（テンプレートがない場合は自動生成）
     vba_binary: bytes | None = None
     actual_has_vba = False
     if include_vba:
-        vba_modules = load_vba_modules()
-        vba_binary = vba_project_binary(vba_modules, regenerate=regenerate_vba)
+        # テンプレートの vbaProject.bin を使う場合はソースの読み込み自体を省略する
+        vba_binary = vba_project_binary(regenerate=regenerate_vba)
         actual_has_vba = vba_binary is not None
 
-    with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("[Content_Types].xml", content_types_xml(len(sheets_xml), has_vml=has_vml, has_vba=actual_has_vba))
-        zf.writestr("_rels/.rels", root_rels_xml())
-        zf.writestr("xl/workbook.xml", workbook_xml(sheet_names, defined_names))
-        zf.writestr("xl/_rels/workbook.xml.rels", workbook_rels_xml(len(sheets_xml), has_vba=actual_has_vba))
-        zf.writestr("xl/styles.xml", styles_xml())
-
-        if actual_has_vba and vba_binary:
-            zf.writestr("xl/vbaProject.bin", vba_binary)
-
-        for idx, xml in enumerate(sheets_xml, start=1):
-            zf.writestr(f"xl/worksheets/sheet{idx}.xml", xml)
-
-            # ボタン付きシートの場合、VML ファイルとリレーションシップを書き込む
-            if idx in vml_sheets:
-                vml_filename, sheet_name_for_vml = vml_sheets[idx]
-                # VML 描画ファイル
-                vml_xml = vml_drawing_xml(buttons, sheet_name_for_vml)
-                zf.writestr(f"xl/drawings/{vml_filename}", vml_xml)
-                # ワークシートリレーションシップ
-                rels_xml = worksheet_rels_xml(vml_rid, vml_filename)
-                if rels_xml:
-                    zf.writestr(f"xl/worksheets/_rels/sheet{idx}.xml.rels", rels_xml)
+    # 同じ引数のシート（サンプルなしの PRJ など）は一度だけ生成・圧縮し、圧縮済みストリームを使い回す
+    sheet_keys = [_sheet_builder_key(build_sheet) for build_sheet in sheet_builders]
+    unique_builders = dict(zip(sheet_keys, sheet_builders))
+    # 並列時はシートの生成と Deflate をワーカーで行い、メインプロセスはヘッダーと圧縮済みデータを書くだけにする
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    try:
+        # ヘッダー・セントラルディレクトリの細かな write をまとめるため、大きめのバッファ付きファイルを渡す
+        with deflate_backend(), \
+                open(output_path, "wb", buffering=ZIP_WRITE_BUFFER_SIZE) as fp, \
+                zipfile.ZipFile(fp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compress_level) as zf:
+            # 固有のシートと vbaProject.bin を先にすべて投入し、書き込みは元の順序で結果を待ちながら行う
+            pending: dict[Hashable, Future] = {}
+            vba_future: Future | None = None
+            sst = SharedStrings() if shared_strings else None
+            if executor is not None:
+                for key, build_sheet in unique_builders.items():
+                    if sst is None:
+                        pending[key] = executor.submit(render_deflated_sheet, build_sheet, zf.compresslevel)
+                    else:
+                        # 共有文字列への変換はシート順にメインプロセスで行うため、ワーカーではシートの生成だけを行う
+                        pending[key] = executor.submit(build_sheet)
+                if actual_has_vba and vba_binary:
+                    vba_future = executor.submit(deflate_part_in_worker, vba_binary, zf.compresslevel)
+
+            write_zip_part(zf, "[Content_Types].xml", content_types_xml(len(sheet_builders), has_vml=has_vml, has_vba=actual_has_vba, has_shared_strings=shared_strings))
+            write_zip_part(zf, "_rels/.rels", root_rels_xml())
+            write_zip_part(zf, "xl/workbook.xml", workbook_xml(sheet_names, WORKBOOK_DEFINED_NAMES_XML))
+            write_zip_part(zf, "xl/_rels/workbook.xml.rels", workbook_rels_xml(len(sheet_builders), has_vba=actual_has_vba, has_shared_strings=shared_strings))
+            write_zip_part(zf, "xl/styles.xml", styles_xml())
+
+            if vba_future is not None:
+                write_deflated_part(zf, "xl/vbaProject.bin", vba_future.result())
+            elif actual_has_vba and vba_binary:
+                write_zip_part(zf, "xl/vbaProject.bin", vba_binary)
+
+            deflated_sheets: dict[Hashable, DeflatedPart] = {}
+            # 共有文字列モードでシートごとの文字列セル数（再利用したシートの参照数も sst.count に加えるため）
+            sheet_string_refs: dict[Hashable, int] = {}
+            # VML 描画はシート間で内容が同じになるため、内容ごとに一度だけ圧縮する
+            deflated_drawings: dict[bytes, DeflatedPart] = {}
+            for idx, (key, build_sheet) in enumerate(zip(sheet_keys, sheet_builders), start=1):
+                deflated = deflated_sheets.get(key)
+                if deflated is None:
+                    if sst is not None:
+                        sheet_xml = pending.pop(key).result() if executor is not None else build_sheet()
+                        refs_before = sst.count
+                        deflated = deflate_part(sst.convert(sheet_xml), zf.compresslevel)
+                        sheet_string_refs[key] = sst.count - refs_before
+                    elif executor is not None:
+                        deflated = pending.pop(key).result()
+                    else:
+                        deflated = deflate_part(build_sheet(), zf.compresslevel)
+                    deflated_sheets[key] = deflated
+                elif sst is not None:
+                    sst.count += sheet_string_refs[key]
+                write_deflated_part(zf, f"xl/worksheets/sheet{idx}.xml", deflated)
+
+                # ボタン付きシートの場合、VML ファイルとリレーションシップを書き込む
+                if idx in vml_sheets:
+                    vml_filename, sheet_name_for_vml = vml_sheets[idx]
+                    # VML 描画ファイル
+                    vml_xml = vml_drawing_xml(buttons, sheet_name_for_vml).encode("utf-8")
+                    deflated_vml = deflated_drawings.get(vml_xml)
+                    if deflated_vml is None:
+                        deflated_vml = deflated_drawings[vml_xml] = deflate_part(vml_xml, zf.compresslevel)
+                    write_deflated_part(zf, f"xl/drawings/{vml_filename}", deflated_vml)
+                    # ワークシートリレーションシップ
+                    rels_xml = worksheet_rels_xml(vml_rid, vml_filename)
+                    if rels_xml:
+                        write_zip_part(zf, f"xl/worksheets/_rels/sheet{idx}.xml.rels", rels_xml)
+
+            if sst is not None:
+                write_zip_part(zf, "xl/sharedStrings.xml", sst.to_xml())
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     ext = output_path.suffix.lower()
     if actual_has_vba:
@@ -1871,9 +2601,21 @@ def build_workbook(
         file_type = "通常ブック (.xlsx)"
 
     m365_note = " [M365専用: FILTER/LET対応]" if m365_mode else ""
-    print(f"ブックを生成しました: {output_path} ({file_type}){m365_note}")
+    logger.info("ブックを生成しました: %s (%s)%s", output_path, file_type, m365_note)
+
+    # 生成日時をブックの生成時点で確定させ、呼び出し側が何度でも使えるようリストで返す
+    return list(generate_report_lines(project_count, sample_first_project, sample_all_projects, output_path))
 
-    return generate_report_lines(project_count, sample_first_project, sample_all_projects, output_path)
+
+def positive_int(value: str) -> int:
+    """argparse 用: 1 以上の整数だけを受け付ける。"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"整数を指定してください: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 以上の整数を指定してください: {number}")
+    return number
 
 
 def main() -> None:
@@ -1940,7 +2682,32 @@ def main() -> None:
         type=Path,
         help="レポート PDF を書き出すパス",
     )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(10),
+        metavar="0-9",
+        help="ZIP の Deflate 圧縮レベル（未指定時は環境変数 PMS_ZIP_LEVEL、なければ 1）",
+    )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=1,
+        help="シートの生成・圧縮を並列実行するプロセス数 (デフォルト: 1 = 逐次)",
+    )
+    parser.add_argument(
+        "--shared-strings",
+        action="store_true",
+        help="文字列セルを共有文字列テーブル (sharedStrings.xml) にまとめて出力する",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="進捗メッセージを出力せず、警告のみ表示する",
+    )
     args = parser.parse_args()
+    # 進捗メッセージはロガー経由で出す（import して呼び出す場合は既定で出力されない）
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format="%(message)s", stream=sys.stdout)
 
     sample_first = args.sample_first and not args.no_sample
     # --legacy フラグが指定された場合は M365 モードを無効化
@@ -1954,15 +2721,18 @@ def main() -> None:
         include_buttons=args.with_buttons,
         regenerate_vba=args.regenerate_vba,
         m365_mode=m365_mode,
+        compress_level=args.compress_level,
+        workers=args.workers,
+        shared_strings=args.shared_strings,
     )
 
     if args.report_output:
         write_report_text(report_lines, args.report_output)
-        print(f"レポートを出力しました: {args.report_output}")
+        logger.info("レポートを出力しました: %s", args.report_output)
 
     if args.pdf_output:
         export_pdf_report(report_lines, args.pdf_output)
-        print(f"PDF レポートを出力しました: {args.pdf_output}")
+        logger.info("PDF レポートを出力しました: %s", args.pdf_output)
 
 
 if __name__ == "__main__":